@@ -4,15 +4,27 @@ This package provides secure encryption and management of sensitive files using
 AES-256-CBC encryption with HMAC authentication.
 """
 
+import functools
 import logging
+import os
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from .core import VaultTool
 
 __version__ = "2.0.0"
 
 # Default logger for the package
 _logger: Optional[logging.Logger] = None
 
+_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+# Default formatters, shared by every setup_logging() call
+_FMT_TS = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt=_DATEFMT)
+# Simpler format without timestamp (better for CLI usage)
+_FMT_NOTS = logging.Formatter("%(levelname)s: %(message)s", datefmt=_DATEFMT)
+
 
 def get_logger(name: str = "vaulttool") -> logging.Logger:
     """Get or create the VaultTool logger.
@@ -35,6 +47,8 @@ def setup_logging(
 
     Sets up the root vaulttool logger with appropriate handlers and formatters.
     This should be called once at application startup, typically from the CLI.
+    Calling it again only reconfigures level and format; the console handler
+    is reused as long as sys.stdout has not been replaced.
 
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -53,27 +67,27 @@ def setup_logging(
     logger = logging.getLogger("vaulttool")
     logger.setLevel(level)
 
-    # Remove existing handlers to avoid duplicates
-    logger.handlers.clear()
-
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
+    if format_string is not None:
+        formatter = logging.Formatter(format_string, datefmt=_DATEFMT)
+    else:
+        formatter = _FMT_TS if include_timestamp else _FMT_NOTS
+
+    # Reuse our console handler unless stdout was swapped (e.g. by a test runner)
+    console_handler = next(
+        (
+            h for h in logger.handlers
+            if type(h) is logging.StreamHandler and h.stream is sys.stdout
+        ),
+        None,
+    )
+    if console_handler is None:
+        console_handler = logging.StreamHandler(sys.stdout)
+
+    # Remove any other handlers to avoid duplicates
+    logger.handlers[:] = [console_handler]
     console_handler.setLevel(level)
-
-    # Create formatter
-    if format_string is None:
-        if include_timestamp:
-            format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        else:
-            # Simpler format without timestamp (better for CLI usage)
-            format_string = "%(levelname)s: %(message)s"
-
-    formatter = logging.Formatter(format_string, datefmt="%Y-%m-%d %H:%M:%S")
     console_handler.setFormatter(formatter)
 
-    # Add handler to logger
-    logger.addHandler(console_handler)
-
     # Prevent propagation to root logger to avoid duplicate messages
     logger.propagate = False
 
@@ -83,9 +97,44 @@ def setup_logging(
     return logger
 
 
+@functools.lru_cache(maxsize=None)
+def _get_vaulttool_for(cwd: str) -> "VaultTool":
+    from .core import VaultTool
+
+    return VaultTool()
+
+
+def get_vaulttool() -> "VaultTool":
+    """Get the shared VaultTool instance for the current working directory.
+
+    Constructing a VaultTool loads and validates the configuration and derives
+    keys from the key file. This factory does that once per working directory
+    and process; subsequent calls return the same instance.
+
+    Call ``get_vaulttool.cache_clear()`` after changing the configuration or
+    the key file in-process (e.g. after a rekey) to force a fresh instance.
+
+    Returns:
+        VaultTool instance configured from the current directory.
+
+    Raises:
+        FileNotFoundError: If no configuration file is found.
+        ValueError: If configuration is invalid or missing required keys.
+
+    Example:
+        >>> from vaulttool import get_vaulttool
+        >>> result = get_vaulttool().encrypt_task()
+    """
+    return _get_vaulttool_for(os.getcwd())
+
+
+get_vaulttool.cache_clear = _get_vaulttool_for.cache_clear  # type: ignore[attr-defined]
+
+
 # For backward compatibility and convenience
 __all__ = [
     "__version__",
     "get_logger",
+    "get_vaulttool",
     "setup_logging",
 ]
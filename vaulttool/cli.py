@@ -14,14 +14,16 @@ Available commands:
 - generate-key: Generate encryption key with backup and rekey options
 """
 
+import functools
 import logging
 import sys
-import secrets
 from pathlib import Path
-from datetime import datetime
+from typing import List, Optional, Tuple
 import typer
-from . import setup_logging, get_logger
-from .core import VaultTool
+from . import setup_logging, get_logger, get_vaulttool
+
+# NOTE: vaulttool.core (and with it cryptography) is only imported by get_vaulttool(),
+# so `version` and `gen-vaulttool` don't pay for it at startup.
 
 # Create app with proper help text
 # Note: Using triple-quoted string with \b to preserve formatting
@@ -59,6 +61,60 @@ verbose_option = typer.Option(False, "--verbose", "-v", help="Enable verbose deb
 quiet_option = typer.Option(False, "--quiet", "-q", help="Show only errors (suppress info/warning)")
 
 
+# Example configuration printed by `gen-vaulttool`
+_EXAMPLE_CONFIG = """---
+# .vaulttool.yml - VaultTool Configuration File
+#
+# This configuration file defines how VaultTool handles file encryption.
+# Save this as .vaulttool.yml in your project root directory.
+#
+# Configuration file search order:
+#   1. ./.vaulttool.yml (current directory)
+#   2. ~/.vaulttool/.vaulttool.yml (user home)
+#   3. /etc/vaulttool/config.yml (system-wide)
+
+vaulttool:
+  # Directories to search for files to encrypt
+  # Defaults to current directory if empty
+  include_directories:
+    - "."
+
+  # Directories to exclude from encryption
+  exclude_directories:
+    - "__pycache__"
+    - ".git"
+    - ".pytest_cache"
+    - ".venv"
+    - "dist"
+    - "node_modules"
+
+  # File patterns to include for encryption
+  include_patterns:
+    - "*.conf"          # Config files
+    - "*.env"           # Environment files
+    - "*.ini"           # Configuration files
+    - "*.json"          # JSON config files
+    - "*.yaml"          # YAML config files
+    - "*.yml"           # YAML config files
+
+  # File patterns to exclude from encryption
+  exclude_patterns:
+    - "*.log"           # Log files
+    - "*.tmp"           # Temporary files
+    - "*.vault"         # Existing vault files
+    - "*example*"       # Example files
+    - "*sample*"        # Sample files
+
+  # Encryption options
+  options:
+    # Suffix added to encrypted files (e.g., config.env -> config.env.vault)
+    suffix: ".vault"
+
+    # Full Path to encryption key file
+    key_file: "/home/USERNAME/.vaulttool/vault.key"
+""".strip()
+
+
 def _setup_cli_logging(verbose: bool = False, quiet: bool = False) -> logging.Logger:
     """Configure logging for CLI based on verbosity flags.
 
@@ -83,14 +139,49 @@ def _setup_cli_logging(verbose: bool = False, quiet: bool = False) -> logging.Lo
     return setup_logging(level=level, include_timestamp=False)
 
 
+def _echo_summary(title: str, rows: List[Tuple[str, int]], width: Optional[int] = None) -> None:
+    """Print a task summary box with a single write.
+
+    Args:
+        title: Heading shown above the counters, e.g. "Encrypt Summary"
+        rows: (label, value) pairs; labels are padded to a common width
+        width: Column where values start (default: longest label + 2)
+    """
+    if width is None:
+        width = max(len(label) for label, _ in rows) + 2
+    lines = ["", "=" * 60, f"{title}:"]
+    lines += [f"  {label + ':':<{width}}{value}" for label, value in rows]
+    lines.append("=" * 60)
+    typer.echo("\n".join(lines))
+
+
+def _parse_pyproject_version(content: str) -> Optional[str]:
+    """Extract the package version from pyproject.toml content.
+
+    Uses tomllib (Python 3.11+) and falls back to a simple line scan on older
+    interpreters.
+    """
+    try:
+        import tomllib
+    except ImportError:
+        for line in content.split('\n'):
+            if line.strip().startswith('version = "'):
+                return line.split('"')[1]
+        return None
+
+    data = tomllib.loads(content)
+    return data.get("project", {}).get("version") or data.get("tool", {}).get("poetry", {}).get("version")
+
+
+@functools.lru_cache(maxsize=1)
 def _get_version() -> str:
-    """Get the version of vaulttool package."""
+    """Get the version of vaulttool package (resolved once per process)."""
     logger = get_logger(__name__)
 
     try:
         from importlib.metadata import version
         pkg_version = version("vaulttool")
-        logger.debug(f"Retrieved version from importlib.metadata: {pkg_version}")
+        logger.debug("Retrieved version from importlib.metadata: %s", pkg_version)
         return pkg_version
     except ImportError:
         # importlib.metadata not available in older Python versions
@@ -101,26 +192,20 @@ def _get_version() -> str:
 
     # Fallback - try to read from pyproject.toml if available
     try:
-        from pathlib import Path
-
         # Look for pyproject.toml in parent directories
         current_dir = Path(__file__).parent
-        logger.debug(f"Looking for pyproject.toml starting from {current_dir}")
+        logger.debug("Looking for pyproject.toml starting from %s", current_dir)
 
         for level in range(3):  # Check up to 3 levels up
             pyproject_path = current_dir / "pyproject.toml"
             if pyproject_path.exists():
-                logger.debug(f"Found pyproject.toml at {pyproject_path}")
-                with open(pyproject_path, "r") as f:
-                    content = f.read()
-                    # Simple parsing for version
-                    for line in content.split('\n'):
-                        if line.strip().startswith('version = "'):
-                            fallback_version = line.split('"')[1]
-                            logger.debug(f"Extracted version from pyproject.toml: {fallback_version}")
-                            return fallback_version
+                logger.debug("Found pyproject.toml at %s", pyproject_path)
+                fallback_version = _parse_pyproject_version(pyproject_path.read_text(encoding="utf-8"))
+                if fallback_version:
+                    logger.debug("Extracted version from pyproject.toml: %s", fallback_version)
+                    return fallback_version
             current_dir = current_dir.parent
-            logger.debug(f"Level {level + 1}: No pyproject.toml found, checking parent")
+            logger.debug("Level %s: No pyproject.toml found, checking parent", level + 1)
 
     except (IOError, OSError) as e:
         logger.warning(f"Failed to read pyproject.toml: {e}")
@@ -174,6 +259,10 @@ Examples:
   vaulttool generate-key --rekey                      # Generate and rekey
   vaulttool generate-key --key-file ~/.vault/key      # Custom location
     """
+    # Only this command needs these; keep them off the startup path of the others
+    import secrets
+    from datetime import datetime
+
     logger = _setup_cli_logging(verbose, quiet)
 
     try:
@@ -275,7 +364,7 @@ Examples:
                 typer.echo("\n[1/5] Restoring plaintext files from vaults...")
 
             try:
-                vt = VaultTool()
+                vt = get_vaulttool()
                 refresh_result = vt.refresh_task(force=True)
 
                 if not quiet:
@@ -351,7 +440,8 @@ Examples:
 
             try:
                 # Reload VaultTool with new key
-                vt = VaultTool()
+                get_vaulttool.cache_clear()
+                vt = get_vaulttool()
                 encrypt_result = vt.encrypt_task(force=True)
 
                 if not quiet:
@@ -431,58 +521,7 @@ includes all available options with comments explaining their purpose.
 Example:
   vaulttool gen-vaulttool > .vaulttool.yml
     """
-    example_config = """---
-# .vaulttool.yml - VaultTool Configuration File
-#
-# This configuration file defines how VaultTool handles file encryption.
-# Save this as .vaulttool.yml in your project root directory.
-#
-# Configuration file search order:
-#   1. ./.vaulttool.yml (current directory)
-#   2. ~/.vaulttool/.vaulttool.yml (user home)
-#   3. /etc/vaulttool/config.yml (system-wide)
-
-vaulttool:
-  # Directories to search for files to encrypt
-  # Defaults to current directory if empty
-  include_directories:
-    - "."
-
-  # Directories to exclude from encryption
-  exclude_directories:
-    - "__pycache__"
-    - ".git"
-    - ".pytest_cache"
-    - ".venv"
-    - "dist"
-    - "node_modules"
-
-  # File patterns to include for encryption
-  include_patterns:
-    - "*.conf"          # Config files
-    - "*.env"           # Environment files
-    - "*.ini"           # Configuration files
-    - "*.json"          # JSON config files
-    - "*.yaml"          # YAML config files
-    - "*.yml"           # YAML config files
-
-  # File patterns to exclude from encryption
-  exclude_patterns:
-    - "*.log"           # Log files
-    - "*.tmp"           # Temporary files
-    - "*.vault"         # Existing vault files
-    - "*example*"       # Example files
-    - "*sample*"        # Sample files
-
-  # Encryption options
-  options:
-    # Suffix added to encrypted files (e.g., config.env -> config.env.vault)
-    suffix: ".vault"
-
-    # Full Path to encryption key file
-    key_file: "/home/USERNAME/.vaulttool/vault.key"
-"""
-    typer.echo(example_config.strip())
+    typer.echo(_EXAMPLE_CONFIG)
 
 
 @app.command()
@@ -503,17 +542,16 @@ Example:
     _setup_cli_logging(verbose, quiet)
 
     try:
-        vt = VaultTool()
+        vt = get_vaulttool()
         result = vt.remove_task()
 
         # Display summary
         if not quiet:
-            typer.echo("\n" + "="*60)
-            typer.echo("Remove Summary:")
-            typer.echo(f"  Total:   {result['total']}")
-            typer.echo(f"  Removed: {result['removed']}")
-            typer.echo(f"  Failed:  {result['failed']}")
-            typer.echo("="*60)
+            _echo_summary("Remove Summary", [
+                ("Total", result['total']),
+                ("Removed", result['removed']),
+                ("Failed", result['failed']),
+            ])
 
         if result['failed'] > 0:
             sys.exit(1)
@@ -551,19 +589,18 @@ Examples:
     _setup_cli_logging(verbose, quiet)
 
     try:
-        vt = VaultTool()
+        vt = get_vaulttool()
         result = vt.encrypt_task(force=force)
 
         # Display summary
         if not quiet:
-            typer.echo("\n" + "="*60)
-            typer.echo("Encrypt Summary:")
-            typer.echo(f"  Total:    {result['total']}")
-            typer.echo(f"  Created:  {result['created']}")
-            typer.echo(f"  Updated:  {result['updated']}")
-            typer.echo(f"  Skipped:  {result['skipped']}")
-            typer.echo(f"  Failed:   {result['failed']}")
-            typer.echo("="*60)
+            _echo_summary("Encrypt Summary", [
+                ("Total", result['total']),
+                ("Created", result['created']),
+                ("Updated", result['updated']),
+                ("Skipped", result['skipped']),
+                ("Failed", result['failed']),
+            ], width=10)
 
         if result['failed'] > 0:
             sys.exit(1)
@@ -605,18 +642,17 @@ Examples:
     _setup_cli_logging(verbose, quiet)
 
     try:
-        vt = VaultTool()
+        vt = get_vaulttool()
         result = vt.refresh_task(force=force)
 
         # Display summary
         if not quiet:
-            typer.echo("\n" + "="*60)
-            typer.echo("Refresh Summary:")
-            typer.echo(f"  Total:     {result['total']}")
-            typer.echo(f"  Succeeded: {result['succeeded']}")
-            typer.echo(f"  Failed:    {result['failed']}")
-            typer.echo(f"  Skipped:   {result['skipped']}")
-            typer.echo("="*60)
+            _echo_summary("Refresh Summary", [
+                ("Total", result['total']),
+                ("Succeeded", result['succeeded']),
+                ("Failed", result['failed']),
+                ("Skipped", result['skipped']),
+            ])
 
         if result['failed'] > 0:
             sys.exit(1)
@@ -644,7 +680,7 @@ Example:
     _setup_cli_logging(verbose, quiet)
 
     try:
-        vt = VaultTool()
+        vt = get_vaulttool()
         vt.check_ignore_task()
     except Exception as e:
         typer.echo(f"ERROR: {e}", err=True)
@@ -11,16 +11,30 @@ Environment Variable Support:
     Examples:
         VAULTTOOL_OPTIONS_KEY_FILE=/path/to/key
         VAULTTOOL_OPTIONS_USE_SUFFIX_FALLBACK=true
+        VAULTTOOL_OPTIONS_USE_CHECKSUM_CACHE=false
         VAULTTOOL_INCLUDE_PATTERNS="*.env,*.secret"
         VAULTTOOL_EXCLUDE_DIRECTORIES=".git,.venv"
 """
 
+import copy
 import os
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 import yaml
 
+from .filestamp import stat_is_racy
+
+try:
+    # libyaml-backed loader; same safe semantics, much faster tokenizing
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+# Parsed YAML documents keyed by resolved config path. Each entry records the
+# (st_mtime_ns, st_size) it was parsed from so edits invalidate it.
+_CONFIG_CACHE: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+
 
 def _parse_bool(value: str) -> bool:
     """Parse boolean value from string.
@@ -93,6 +107,8 @@ def _apply_env_overrides(config: Dict[str, Any]) -> Dict[str, Any]:
         "options.algorithm": f"{env_prefix}OPTIONS_ALGORITHM",
         "options.openssl_path": f"{env_prefix}OPTIONS_OPENSSL_PATH",
         "options.use_suffix_fallback": f"{env_prefix}OPTIONS_USE_SUFFIX_FALLBACK",
+        "options.use_checksum_cache": f"{env_prefix}OPTIONS_USE_CHECKSUM_CACHE",
+        "options.concurrency": f"{env_prefix}OPTIONS_CONCURRENCY",
     }
 
     for config_key, env_var in env_mappings.items():
@@ -112,9 +128,15 @@ def _apply_env_overrides(config: Dict[str, Any]) -> Dict[str, Any]:
                 config[parent_key] = {}
 
             # Determine value type and parse
-            if child_key in ("use_suffix_fallback",):
+            if child_key in ("use_suffix_fallback", "use_checksum_cache"):
                 # Boolean values
                 config[parent_key][child_key] = _parse_bool(env_value)
+            elif child_key in ("concurrency",):
+                # Integer values
+                try:
+                    config[parent_key][child_key] = int(env_value)
+                except ValueError:
+                    raise ValueError(f"{env_var} must be an integer, got: {env_value!r}")
             else:
                 # String values
                 config[parent_key][child_key] = env_value
@@ -130,6 +152,35 @@ def _apply_env_overrides(config: Dict[str, Any]) -> Dict[str, Any]:
     return config
 
 
+def _read_yaml(config_path: Path) -> Any:
+    """Parse a YAML file, reusing the previous result if the file is unchanged.
+
+    Repeated VaultTool() constructions in one process (CLI rekey, tests, demos)
+    otherwise re-parse the same file every time. Callers receive a deep copy so
+    later mutation (env overrides, suffix normalization) never leaks into the cache.
+
+    Args:
+        config_path: Path to the YAML file.
+
+    Returns:
+        The parsed YAML document (empty dict for an empty file).
+    """
+    st = config_path.stat()
+    key = config_path.resolve()
+    stamp = (st.st_mtime_ns, st.st_size)
+
+    cached = _CONFIG_CACHE.get(key)
+    if cached is None or cached[0] != stamp:
+        with open(config_path, "rb") as f:
+            data = yaml.load(f, Loader=_SafeLoader) or {}
+        cached = (stamp, data)
+        # Recently modified files are re-parsed every time (see stat_is_racy)
+        if not stat_is_racy(st):
+            _CONFIG_CACHE[key] = cached
+
+    return copy.deepcopy(cached[1])
+
+
 def load_config(path: str = ".vaulttool.yml") -> Dict[str, Any]:
     """Load and validate the VaultTool configuration file.
 
@@ -183,8 +234,7 @@ def load_config(path: str = ".vaulttool.yml") -> Dict[str, Any]:
             f"Configuration file not found at {path}. Please create a .vaulttool.yml file or specify the correct path."
         )
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+    data = _read_yaml(config_path)
 
     # Support the documented structure with a top-level `vaulttool` key
     cfg = data.get("vaulttool", data)
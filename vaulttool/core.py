@@ -20,14 +20,32 @@ Environment Variables:
 
 import base64
 import binascii
+import hashlib
+import hmac
+import fnmatch
+import functools
+import itertools
 import logging
+import mmap
 import os
+import re
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from .config import load_config
-from .utils import compute_hmac, derive_keys, encode_base64
+from .utils import (
+    CACHE_DIR_NAME,
+    MMAP_THRESHOLD,
+    HmacCache,
+    atomic_file,
+    derive_keys,
+    iter_base64,
+    stat_is_racy,
+    walk_files,
+    write_private_file,
+)
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import padding as sym_padding
 
 logger = logging.getLogger(__name__)
@@ -38,6 +56,37 @@ VAULTTOOL_PRECOMMIT: bool = bool(os.environ.get("VAULTTOOL_PRECOMMIT"))
 # Maximum file size to prevent memory exhaustion (100MB)
 MAX_FILE_SIZE: int = 100 * 1024 * 1024
 
+# Plaintext bytes encrypted and base64-encoded per step when writing a vault
+ENCRYPT_CHUNK_SIZE: int = 3 * 64 * 1024
+
+# Default number of files processed concurrently (ThreadPoolExecutor's default sizing)
+DEFAULT_CONCURRENCY: int = min(32, (os.cpu_count() or 1) + 4)
+
+
+@functools.lru_cache(maxsize=8)
+def _resolved_cwd(cwd: str) -> Path:
+    """Resolve a working directory path once; it is checked for every file."""
+    return Path(cwd).resolve()
+
+
+def _build_matcher(patterns: Iterable[str]) -> Callable[[str], bool]:
+    """Compile glob patterns into a single predicate on file names.
+
+    ``fnmatch``/``Path.match`` translate the pattern on every call; joining the
+    translated patterns into one regex compiles them once and tests all of them
+    in a single C-level match.
+
+    Args:
+        patterns: Glob patterns matched against a file name (e.g. '*.env').
+
+    Returns:
+        Callable returning a truthy value when the name matches any pattern.
+    """
+    patterns = list(patterns)
+    if not patterns:
+        return lambda name: False
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns)).match
+
 
 class VaultTool:
     """A tool for encrypting and managing sensitive files using AES-256-CBC.
@@ -65,6 +114,8 @@ class VaultTool:
         exclude_directories: Directories to exclude from search.
         include_patterns: File patterns to include (e.g., '*.env').
         exclude_patterns: File patterns to exclude.
+        use_checksum_cache: Whether source HMACs are cached in .vaulttool-cache/.
+        concurrency: Maximum number of files processed in parallel.
         hmac_key: Derived HMAC key for authentication (32 bytes).
         encryption_key: Derived encryption key for AES-256 (32 bytes).
     """
@@ -93,17 +144,56 @@ class VaultTool:
         self.algorithm = options.get("algorithm", "aes-256-cbc")
         self.openssl_path = options.get("openssl_path", "openssl")
         self.use_suffix_fallback = options.get("use_suffix_fallback", True)  # Default: enabled for flexible vault discovery
+        self.use_checksum_cache = options.get("use_checksum_cache", True)
+        self.concurrency = options.get("concurrency", DEFAULT_CONCURRENCY)
+        if not isinstance(self.concurrency, int) or isinstance(self.concurrency, bool) or self.concurrency < 1:
+            raise ValueError(f"'options.concurrency' must be a positive integer, got: {self.concurrency!r}")
         self.include_directories = config.get("include_directories", ["." ])
         self.exclude_directories = set(config.get("exclude_directories", []))
         self.include_patterns = config.get("include_patterns", [])
         self.exclude_patterns = set(config.get("exclude_patterns", []))
 
+        # Source file filters, compiled once. Name-only patterns become a single
+        # regex; patterns containing a path separator still need Path.rglob /
+        # Path.match to compare trailing path components.
+        self._is_included_name = _build_matcher(p for p in self.include_patterns if "/" not in p)
+        self._include_path_patterns = [p for p in self.include_patterns if "/" in p]
+        self._is_excluded_name = _build_matcher(p for p in self.exclude_patterns if "/" not in p)
+        self._exclude_path_patterns = [p for p in self.exclude_patterns if "/" in p]
+        self._exclude_dir_search = (
+            re.compile("|".join(re.escape(d) for d in self.exclude_directories)).search
+            if self.exclude_directories else None
+        )
+
         # Set up logger for this instance
         self.logger = logger
 
         # Derive HMAC and encryption keys from master key using HKDF
         self.hmac_key, self.encryption_key = derive_keys(self.key_file)
 
+        # AES algorithm object (validated key) reused by every Cipher in this run;
+        # the key schedule itself is still set up per encryptor/decryptor.
+        self._aes = algorithms.AES(self.encryption_key)
+
+        # Source HMACs keyed by stat stamp, so unchanged files are not re-hashed
+        self._hmac_cache = HmacCache(self.hmac_key) if self.use_checksum_cache else None
+
+        # .gitignore entries are written relative to the working directory at startup
+        self._cwd = os.getcwd()
+        self._gitignore_path = os.path.join(self._cwd, ".gitignore")
+
+        # Parsed .gitignore (reused while its stat stamp is unchanged) and
+        # entries queued by add_to_gitignore(flush=False)
+        self._gitignore_lines: Optional[set] = None
+        self._gitignore_stamp: Optional[Tuple[int, int, int]] = None
+        self._gitignore_checked = False
+        self._gitignore_frozen = False
+        self._gitignore_pending: List[str] = []
+
+        # Last tree walk (see _scan) and the stat stamps of the directories it listed
+        self._scan_result: Optional[Tuple[List[Path], List[str]]] = None
+        self._scan_stamps: Dict[str, Optional[Tuple[int, int]]] = {}
+
     def _validate_file_path(self, file_path: str, require_exists: bool = True) -> Path:
         """Validate and resolve a file path for security.
 
@@ -124,7 +214,7 @@ class VaultTool:
         file_path_obj = Path(file_path)
 
         # Check for symlinks BEFORE resolving (to catch symlink itself)
-        if file_path_obj.exists() and file_path_obj.is_symlink():
+        if file_path_obj.is_symlink():
             raise ValueError(f"Symlinks not allowed for security: {file_path}")
 
         # Now resolve the path
@@ -134,20 +224,19 @@ class VaultTool:
             else:
                 resolved = file_path_obj.resolve(strict=False)
         except (OSError, RuntimeError) as e:
-            self.logger.debug(f"Path resolution failed for '{file_path}': {e}", exc_info=True)
+            self.logger.debug("Path resolution failed for '%s': %s", file_path, e, exc_info=True)
             raise ValueError(f"Invalid file path '{file_path}': {e}") from e
 
         # Check file is within current working directory
-        cwd = Path.cwd().resolve()
+        cwd = _resolved_cwd(os.getcwd())
         try:
             resolved.relative_to(cwd)
         except ValueError:
             raise ValueError(f"File path outside working directory: {file_path}")
 
         # Check it's a regular file (not directory, device, socket, etc.)
-        if resolved.exists():
-            if not resolved.is_file():
-                raise ValueError(f"Path is not a regular file: {file_path}")
+        if not resolved.is_file() and resolved.exists():
+            raise ValueError(f"Path is not a regular file: {file_path}")
 
         return resolved
 
@@ -188,11 +277,8 @@ class VaultTool:
             >>> VaultTool.source_filename("config.env.secret.vault", ".secret.vault")
             "config.env"
         """
-        if not vault_path.endswith(suffix):
-            return vault_path  # Not a vault file; return as is
-
-        # Remove the suffix
-        return vault_path[:-len(suffix)]
+        # Paths without the suffix are not vault files and come back unchanged
+        return vault_path.removesuffix(suffix)
 
     def vault_filename(self, source_path: str, suffix: str | None = None) -> str:
         """Convert a source file path to its corresponding vault file path.
@@ -237,10 +323,7 @@ class VaultTool:
             Output format: IV (16 bytes) + Encrypted Data (variable length)
             The IV is randomly generated for each encryption operation.
         """
-        logger.debug(f"Encrypting file: {source_path} -> {encrypted_path}")
-
-        # Validate source path for security (must exist and be within workspace)
-        source = self._validate_file_path(source_path, require_exists=True)
+        logger.debug("Encrypting file: %s -> %s", source_path, encrypted_path)
 
         # For encrypted_path, just ensure parent directory exists
         # (we don't validate it against workspace since it's output)
@@ -248,46 +331,108 @@ class VaultTool:
         if not encrypted.parent.exists():
             raise ValueError(f"Parent directory does not exist: {encrypted.parent}")
 
-        # Check file size to prevent memory exhaustion
-        file_size = source.stat().st_size
-        logger.debug(f"Source file size: {file_size} bytes")
-        if file_size > MAX_FILE_SIZE:
-            logger.error(f"File too large: {file_size} bytes (maximum {MAX_FILE_SIZE} bytes)")
-            raise ValueError(f"File too large: {file_size} bytes (maximum {MAX_FILE_SIZE} bytes / {MAX_FILE_SIZE // (1024*1024)}MB)")
+        # Write IV + ciphertext to file; an interrupted write leaves the old file intact
+        with atomic_file(encrypted_path) as f:
+            f.write(self._encrypt_source(source_path))
+
+        logger.debug("Successfully wrote encrypted file: %s", encrypted_path)
+
+    @contextmanager
+    def _open_source(self, source_path: str) -> Iterator[Any]:
+        """Validate a source file and expose its content as a buffer.
+
+        Large files are memory-mapped instead of copied into memory; the
+        buffer is only valid inside the ``with`` block.
+
+        Args:
+            source_path: Path to the plaintext file.
+
+        Yields:
+            The file content as ``bytes`` or a read-only ``mmap``.
+
+        Raises:
+            IOError: If the source file cannot be read.
+            ValueError: If the path is invalid or the file is too large.
+        """
+        # Validate source path for security (must exist and be within workspace)
+        source = self._validate_file_path(source_path, require_exists=True)
 
-        # Read plaintext
         with open(source, "rb") as f:
-            plaintext = f.read()
+            # Check file size to prevent memory exhaustion
+            file_size = os.fstat(f.fileno()).st_size
+            logger.debug("Source file size: %s bytes", file_size)
+            if file_size > MAX_FILE_SIZE:
+                logger.error(f"File too large: {file_size} bytes (maximum {MAX_FILE_SIZE} bytes)")
+                raise ValueError(f"File too large: {file_size} bytes (maximum {MAX_FILE_SIZE} bytes / {MAX_FILE_SIZE // (1024*1024)}MB)")
+
+            if file_size > MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    yield mm
+            else:
+                yield f.read()
 
-        # Generate random IV (16 bytes for AES)
-        iv = os.urandom(16)
+    def _encrypt_source(self, source_path: str) -> bytes:
+        """Encrypt a source file in memory.
 
-        # Apply PKCS7 padding to plaintext
-        padder = sym_padding.PKCS7(128).padder()  # 128 bits = 16 bytes block size
-        padded_plaintext = padder.update(plaintext) + padder.finalize()
+        Args:
+            source_path: Path to the plaintext file to encrypt.
 
-        # Create cipher and encrypt
-        cipher = Cipher(
-            algorithms.AES(self.encryption_key),
-            modes.CBC(iv),
-            backend=default_backend()
-        )
-        encryptor = cipher.encryptor()
-        ciphertext = encryptor.update(padded_plaintext) + encryptor.finalize()
+        Returns:
+            IV (16 bytes) followed by the AES-256-CBC ciphertext.
+
+        Raises:
+            IOError: If the source file cannot be read.
+            ValueError: If the path is invalid or the file is too large.
+        """
+        with self._open_source(source_path) as plaintext:
+            return self._encrypt_data(plaintext)
+
+    def _encrypt_data(self, plaintext: Any) -> bytes:
+        """Encrypt a plaintext buffer with a fresh random IV.
+
+        Args:
+            plaintext: Bytes-like plaintext (``bytes`` or ``mmap``).
+
+        Returns:
+            IV (16 bytes) followed by the AES-256-CBC ciphertext.
+
+        Raises:
+            ValueError: If the encrypted output is implausibly small.
+        """
+        encrypted = b"".join(self._iter_encrypted(plaintext))
 
         # Validate encrypted output
-        encrypted_size = len(iv + ciphertext)
+        encrypted_size = len(encrypted)
         if encrypted_size < 32:  # At least IV (16) + one AES block (16)
             logger.error(f"Encrypted output suspiciously small: {encrypted_size} bytes")
             raise ValueError(f"Encrypted output suspiciously small: {encrypted_size} bytes (minimum 32)")
 
-        logger.debug(f"Encrypted {file_size} bytes -> {encrypted_size} bytes (IV: 16 + ciphertext: {len(ciphertext)})")
+        logger.debug("Encrypted %s bytes -> %s bytes (IV: 16 + ciphertext: %s)", len(plaintext), encrypted_size, encrypted_size - 16)
+
+        return encrypted
+
+    def _iter_encrypted(self, plaintext: Any) -> Iterator[bytes]:
+        """Encrypt a plaintext buffer piecewise with a fresh random IV.
 
-        # Write IV + ciphertext to file
-        with open(encrypted_path, "wb") as f:
-            f.write(iv + ciphertext)
+        Args:
+            plaintext: Bytes-like plaintext (``bytes`` or ``mmap``).
 
-        logger.debug(f"Successfully wrote encrypted file: {encrypted_path}")
+        Yields:
+            The IV (16 bytes), then ciphertext for at most ENCRYPT_CHUNK_SIZE
+            plaintext bytes at a time, then the final padded block(s).
+        """
+        # Generate random IV (16 bytes for AES)
+        iv = os.urandom(16)
+        yield iv
+
+        # PKCS7 padding (128 bits = 16 bytes block size) feeding AES-256-CBC
+        padder = sym_padding.PKCS7(128).padder()
+        encryptor = Cipher(self._aes, modes.CBC(iv)).encryptor()
+        with memoryview(plaintext) as view:
+            for offset in range(0, len(view), ENCRYPT_CHUNK_SIZE):
+                with view[offset:offset + ENCRYPT_CHUNK_SIZE] as chunk:
+                    yield encryptor.update(padder.update(chunk))
+        yield encryptor.update(padder.finalize()) + encryptor.finalize()
 
     def decrypt_file(self, encrypted_path: str, output_path: str):
         """Decrypt a single file using AES-256-CBC with derived encryption key.
@@ -308,7 +453,7 @@ class VaultTool:
             Input format: IV (16 bytes) + Encrypted Data (variable length)
             The IV is read from the first 16 bytes of the encrypted file.
         """
-        logger.debug(f"Decrypting file: {encrypted_path} -> {output_path}")
+        logger.debug("Decrypting file: %s -> %s", encrypted_path, output_path)
 
         # Validate encrypted input path for security
         encrypted = self._validate_file_path(encrypted_path, require_exists=True)
@@ -323,6 +468,25 @@ class VaultTool:
         with open(encrypted, "rb") as f:
             encrypted_data = f.read()
 
+        plaintext = self._decrypt_bytes(encrypted_data)
+
+        # Write plaintext to output file (owner-only permissions for new files)
+        write_private_file(output_path, plaintext)
+
+        logger.debug("Successfully wrote decrypted file: %s", output_path)
+
+    def _decrypt_bytes(self, encrypted_data: bytes) -> bytes:
+        """Decrypt IV + ciphertext in memory.
+
+        Args:
+            encrypted_data: IV (16 bytes) followed by the AES-256-CBC ciphertext.
+
+        Returns:
+            The decrypted, unpadded plaintext.
+
+        Raises:
+            ValueError: If the data is malformed or decryption fails.
+        """
         # Extract IV and ciphertext with validation
         if len(encrypted_data) < 16:
             logger.error(f"Encrypted file too short: {len(encrypted_data)} bytes (missing IV)")
@@ -338,17 +502,13 @@ class VaultTool:
             logger.error(f"Invalid ciphertext length: {ciphertext_len} bytes (not multiple of 16)")
             raise ValueError(f"Invalid ciphertext length: {ciphertext_len} bytes (not multiple of 16-byte block size)")
 
-        logger.debug(f"Encrypted data: {len(encrypted_data)} bytes (IV: 16, ciphertext: {ciphertext_len})")
+        logger.debug("Encrypted data: %s bytes (IV: 16, ciphertext: %s)", len(encrypted_data), ciphertext_len)
 
         iv = encrypted_data[:16]
         ciphertext = encrypted_data[16:]
 
         # Create cipher and decrypt
-        cipher = Cipher(
-            algorithms.AES(self.encryption_key),
-            modes.CBC(iv),
-            backend=default_backend()
-        )
+        cipher = Cipher(self._aes, modes.CBC(iv))
         decryptor = cipher.decryptor()
         padded_plaintext = decryptor.update(ciphertext) + decryptor.finalize()
 
@@ -356,19 +516,33 @@ class VaultTool:
         unpadder = sym_padding.PKCS7(128).unpadder()
         plaintext = unpadder.update(padded_plaintext) + unpadder.finalize()
 
-        logger.debug(f"Decrypted {len(ciphertext)} bytes -> {len(plaintext)} bytes plaintext")
+        logger.debug("Decrypted %s bytes -> %s bytes plaintext", len(ciphertext), len(plaintext))
 
         # Validate decrypted output isn't empty
         if len(plaintext) == 0:
             logger.warning("Decryption produced empty output (0 bytes)")
 
-        # Write plaintext to output file
-        with open(output_path, "wb") as f:
-            f.write(plaintext)
+        return plaintext
+
+    def _map_files(self, func: Callable[[Any], Any], files: List[Any]) -> List[Any]:
+        """Apply a per-file operation to every file, in parallel when worthwhile.
 
-        logger.debug(f"Successfully wrote decrypted file: {output_path}")
+        Per-file work is independent and dominated by file I/O and AES, both of
+        which release the GIL, so a thread pool overlaps it across files.
 
-    def add_to_gitignore(self, file_path: Path):
+        Args:
+            func: Operation to run for each file. Must not raise.
+            files: Files to process.
+
+        Returns:
+            Results of ``func`` in the same order as ``files``.
+        """
+        if self.concurrency <= 1 or len(files) <= 1:
+            return [func(f) for f in files]
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(files))) as pool:
+            return list(pool.map(func, files))
+
+    def add_to_gitignore(self, file_path: Path, flush: bool = True):
         """Add a file to .gitignore if not already present.
 
         Ensures that sensitive source files are automatically added to .gitignore
@@ -376,23 +550,167 @@ class VaultTool:
 
         Args:
             file_path: Path to the file to add to .gitignore.
+            flush: Write the entry immediately. Pass False to buffer several
+                additions (checked against a single read of .gitignore) and
+                write them with one flush_gitignore() call.
 
         Note:
             Skips operation when VAULTTOOL_PRECOMMIT environment variable is set
             to avoid modifying .gitignore during pre-commit hooks or CI runs.
         """
-        if VAULTTOOL_PRECOMMIT and (Path(".git").exists()):
-            return  # Avoid touching .gitignore in pre-commit/CI runs
-        gitignore_path = Path(".gitignore")
-        if not gitignore_path.exists():
-            gitignore_path.touch()
-        with open(gitignore_path, "r", encoding="utf-8") as gi:
-            gitignore_lines = set(line.strip() for line in gi if line.strip())
-        rel_path = os.path.relpath(file_path, Path().absolute())
-        if rel_path not in gitignore_lines:
-            with open(gitignore_path, "a", encoding="utf-8") as gi:
-                gi.write(f"{rel_path}\n")
-            logger.info(f"Added {rel_path} to .gitignore")
+        if not self._gitignore_checked:
+            # Decided once per batch rather than once per file
+            self._gitignore_frozen = VAULTTOOL_PRECOMMIT and Path(".git").exists()
+            if not self._gitignore_frozen:
+                self._load_gitignore()
+            self._gitignore_checked = True
+        if not self._gitignore_frozen:  # Avoid touching .gitignore in pre-commit/CI runs
+            path = os.fspath(file_path)
+            rel_path = os.path.relpath(path, self._cwd) if os.path.isabs(path) else os.path.normpath(path)
+            if rel_path not in self._gitignore_lines:
+                self._gitignore_lines.add(rel_path)
+                self._gitignore_pending.append(rel_path)
+                logger.info("Added %s to .gitignore", rel_path)
+        if flush:
+            self.flush_gitignore()
+
+    def flush_gitignore(self):
+        """Append entries buffered by add_to_gitignore() to .gitignore in one write.
+
+        The next addition re-checks .gitignore's stat stamp and re-reads the
+        file only if it changed.
+        """
+        if self._gitignore_pending:
+            with open(self._gitignore_path, "a", encoding="utf-8") as gi:
+                gi.write("".join(f"{rel_path}\n" for rel_path in self._gitignore_pending))
+            self._gitignore_pending.clear()
+            self._gitignore_stamp = None
+        self._gitignore_checked = False
+
+    def _load_gitignore(self):
+        """Parse .gitignore into a set of lines unless the parsed copy is current.
+
+        The parsed set is reused while .gitignore's (inode, mtime, size) stamp
+        is unchanged, so repeated source listings in one process only stat it.
+        """
+        try:
+            st = os.stat(self._gitignore_path)
+        except FileNotFoundError:
+            self._gitignore_lines = set()
+            self._gitignore_stamp = None
+            return
+
+        stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if self._gitignore_lines is not None and stamp == self._gitignore_stamp:
+            return
+
+        with open(self._gitignore_path, "r", encoding="utf-8") as gi:
+            self._gitignore_lines = set(line.strip() for line in gi if line.strip())
+        self._gitignore_stamp = None if stat_is_racy(st) else stamp
+
+    def _scan(self) -> Tuple[List[Path], List[str]]:
+        """Walk the include directories once, collecting source and vault files.
+
+        iter_source_files and iter_vault_files are both served from this walk.
+        The result is kept together with the stat stamp of every directory that
+        was listed and reused until one of them changes, so back-to-back calls
+        on the same instance do not walk the tree again.
+
+        Returns:
+            Tuple of (source files, vault paths). Source files have the include
+            and exclude filters applied; vault paths carry the configured suffix
+            (or '.vault' as well when suffix fallback applies).
+        """
+        if self._scan_result is not None and all(
+            self._dir_stamp(path) == stamp for path, stamp in self._scan_stamps.items()
+        ):
+            return self._scan_result
+
+        is_included_name = self._is_included_name
+        include_path_patterns = self._include_path_patterns
+        is_excluded_name = self._is_excluded_name
+        exclude_path_patterns = self._exclude_path_patterns
+        exclude_dir_search = self._exclude_dir_search
+        if self.use_suffix_fallback and self.suffix != ".vault":
+            is_vault_name = self._is_any_vault_name
+        else:
+            is_vault_name = self._is_vault_name
+
+        def is_wanted_name(name: str) -> bool:
+            return is_included_name(name) or is_vault_name(name)
+
+        def is_excluded_path(path: str) -> bool:
+            # Exclude directories match as substrings anywhere in the path
+            return exclude_dir_search is not None and exclude_dir_search(os.path.normpath(path)) is not None
+
+        def prune(dir_path: str) -> bool:
+            # VaultTool's own cache holds neither secrets nor vaults
+            return os.path.basename(dir_path) == CACHE_DIR_NAME
+
+        stamps: Dict[str, Optional[Tuple[int, int]]] = {}
+        racy = False
+
+        def stamp_dir(dir_path: str):
+            nonlocal racy
+            try:
+                st = os.stat(dir_path)
+            except OSError:
+                stamps[dir_path] = None
+                return
+            stamps[dir_path] = (st.st_ino, st.st_mtime_ns)
+            # An entry added within the same timestamp tick would go unnoticed
+            racy = racy or stat_is_racy(st)
+
+        sources: List[Path] = []
+        vaults: List[str] = []
+        for dir in self.include_directories:
+            candidates: List[str] = []
+            for path in walk_files(dir, is_wanted_name, prune, stamp_dir):
+                name = os.path.basename(path)
+                if is_vault_name(name):
+                    vaults.append(path)
+                if is_included_name(name):
+                    candidates.append(path)
+            if include_path_patterns:
+                rglob_hits = (
+                    str(p) for pattern in include_path_patterns for p in Path(dir).rglob(pattern) if p.is_file()
+                )
+                # A file may match both kinds of pattern; report it once
+                candidates = list(dict.fromkeys(os.path.normpath(p) for p in itertools.chain(candidates, rglob_hits)))
+
+            for path in candidates:
+                source_file = Path(path)
+                if is_excluded_name(source_file.name):
+                    continue
+                if exclude_path_patterns and any(source_file.match(ex_pat) for ex_pat in exclude_path_patterns):
+                    continue
+                if is_excluded_path(path):
+                    continue
+                if CACHE_DIR_NAME in source_file.parts:
+                    continue
+                sources.append(source_file)
+
+        result = (sources, vaults)
+        if racy:
+            self._invalidate_scan()
+        else:
+            self._scan_result = result
+            self._scan_stamps = stamps
+        return result
+
+    @staticmethod
+    def _dir_stamp(path: str) -> Optional[Tuple[int, int]]:
+        """Return (inode, mtime_ns) of a directory, or None if it cannot be read."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_mtime_ns)
+
+    def _invalidate_scan(self):
+        """Forget the cached tree walk; the next _scan() lists the directories again."""
+        self._scan_result = None
+        self._scan_stamps = {}
 
     def iter_source_files(self):
         """Generator for all source files matching the configured patterns.
@@ -407,17 +725,18 @@ class VaultTool:
 
         Note:
             Files are automatically added to .gitignore as they are discovered
-            to prevent accidental commits of sensitive data.
+            to prevent accidental commits of sensitive data. New entries are
+            written once the generator is exhausted or closed.
         """
-        for dir in self.include_directories:
-            for pattern in self.include_patterns:
-                for source_file in Path(dir).rglob(pattern):
-                    if any(source_file.match(ex_pat) for ex_pat in self.exclude_patterns):
-                        continue
-                    if any(ex_dir in str(source_file) for ex_dir in self.exclude_directories):
-                        continue
-                    self.add_to_gitignore(source_file)
-                    yield source_file
+        sources, _ = self._scan()
+
+        # .gitignore is read once and new entries are appended in one write
+        try:
+            for source_file in sources:
+                self.add_to_gitignore(source_file, flush=False)
+                yield source_file
+        finally:
+            self.flush_gitignore()
 
     def iter_vault_files(self):
         """Generator for all vault files matching the configured suffix.
@@ -433,39 +752,43 @@ class VaultTool:
                   with '.vault' files as fallback only if custom suffix doesn't exist
                   for that source file.
         """
+        _, vault_paths = self._scan()
+
         if self.use_suffix_fallback and self.suffix != ".vault":
             # Suffix fallback enabled with custom suffix
             # Group by source file and prefer custom suffix over .vault fallback
             vault_files_by_source = {}
-
-            # Collect all vault files (both custom suffix and .vault)
-            for dir in self.include_directories:
-                # Find files with custom suffix
-                for vault_file in Path(dir).rglob(f"*{self.suffix}"):
-                    source = self.source_filename(str(vault_file), self.suffix)
-                    vault_files_by_source[source] = vault_file
-
-                # Find files with .vault suffix as fallback
-                # IMPORTANT: Only search for .vault if it's different from custom suffix
-                # to avoid finding custom suffix files twice (e.g., .secret.vault ends with .vault)
-                for vault_file in Path(dir).rglob("*.vault"):
-                    # Skip if this file matches the custom suffix pattern
-                    if str(vault_file).endswith(self.suffix):
-                        continue
-
-                    source = self.source_filename(str(vault_file), ".vault")
-                    # Only use .vault as fallback if custom suffix doesn't exist
-                    if source not in vault_files_by_source:
-                        vault_files_by_source[source] = vault_file
+            fallback_files = []
+            for vault_path in vault_paths:
+                if vault_path.endswith(self.suffix):
+                    source = self.source_filename(vault_path, self.suffix)
+                    vault_files_by_source[source] = Path(vault_path)
+                else:
+                    fallback_files.append(vault_path)
+
+            # Only use .vault as fallback if custom suffix doesn't exist
+            # (custom suffix files such as .secret.vault also end with .vault
+            # and were classified above, so they are never counted twice)
+            for vault_path in fallback_files:
+                source = self.source_filename(vault_path, ".vault")
+                if source not in vault_files_by_source:
+                    vault_files_by_source[source] = Path(vault_path)
 
             # Yield preferred vault files
             for vault_file in vault_files_by_source.values():
                 yield vault_file
         else:
             # Traditional behavior: yield all vault files with configured suffix
-            for dir in self.include_directories:
-                for vault_file in Path(dir).rglob(f"*{self.suffix}"):
-                    yield vault_file
+            for vault_path in vault_paths:
+                yield Path(vault_path)
+
+    def _is_vault_name(self, name: str) -> bool:
+        """Return True if a file name carries the configured vault suffix."""
+        return name.endswith(self.suffix)
+
+    def _is_any_vault_name(self, name: str) -> bool:
+        """Return True if a file name carries the configured or the fallback '.vault' suffix."""
+        return name.endswith(self.suffix) or name.endswith(".vault")
 
     def iter_missing_sources(self):
         """Generator for source files that are missing but have corresponding vault files.
@@ -519,131 +842,21 @@ class VaultTool:
         logger.info(f"Starting refresh task (force={force})")
 
         # Initialize counters for aggregation
-        total = 0
-        succeeded = 0
-        failed = 0
-        skipped = 0
+        counts = {'succeeded': 0, 'failed': 0, 'skipped': 0}
         errors = []
 
         vault_files = list(self.iter_vault_files())
-        logger.info(f"Found {len(vault_files)} vault files to process")
-
-        for vault_file in vault_files:
-            total += 1
-            # Determine which suffix this vault file uses
-            # When fallback is enabled, files might have different suffixes
-            if str(vault_file).endswith(self.suffix):
-                vault_suffix = self.suffix
-            elif self.use_suffix_fallback and str(vault_file).endswith(".vault"):
-                vault_suffix = ".vault"
-            else:
-                # Unknown suffix, skip
-                logger.warning(f"Vault file {vault_file} doesn't match any known suffix pattern")
-                skipped += 1
-                continue
-
-            source_file = Path(self.source_filename(str(vault_file), vault_suffix))
-
-            if source_file.exists() and not force:
-                logger.debug(f"Skipping existing source file: {source_file}")
-                skipped += 1
-                continue
-
-            # Read vault file with validation
-            try:
-                logger.debug(f"Reading vault file: {vault_file}")
-                with open(vault_file, "r", encoding="utf-8") as vf:
-                    lines = vf.readlines()
-                    if len(lines) < 2:
-                        raise ValueError("Vault file has insufficient lines (expected at least 2)")
-                    stored_hmac = lines[0].strip()
-                    encrypted_b64 = lines[1].strip()
-            except (IOError, OSError) as e:
-                logger.error(f"Failed to read vault file {vault_file}: {e}")
-                errors.append((str(vault_file), f"Read error: {e}"))
-                failed += 1
-                continue
-            except ValueError as e:
-                logger.warning(f"Malformed vault file {vault_file}: {e}")
-                errors.append((str(vault_file), f"Malformed: {e}"))
-                failed += 1
-                continue
-
-            # Validate HMAC format
-            if not self._is_valid_hmac(stored_hmac):
-                logger.error(f"Invalid HMAC format in {vault_file} (expected 64 hex chars)")
-                errors.append((str(vault_file), "Invalid HMAC format"))
-                failed += 1
-                continue
-
-            # Validate and decode base64
-            if not encrypted_b64:
-                logger.error(f"Empty encrypted content in {vault_file}")
-                errors.append((str(vault_file), "Empty encrypted content"))
-                failed += 1
-                continue
-
-            try:
-                encrypted_data = base64.b64decode(encrypted_b64, validate=True)
-            except (binascii.Error, ValueError) as e:
-                logger.error(f"Invalid base64 encoding in {vault_file}: {e}")
-                errors.append((str(vault_file), f"Base64 decode error: {e}"))
-                failed += 1
-                continue
-
-            # Write to temp file and decrypt
-            temp_path = str(vault_file) + ".tmp"
-            try:
-                logger.debug(f"Decrypting {vault_file} -> {source_file}")
-                with open(temp_path, "wb") as tf:
-                    tf.write(encrypted_data)
-
-                # Decrypt to source file
-                self.decrypt_file(temp_path, str(source_file))
-
-                # CRITICAL: Verify HMAC after decryption
-                computed_hmac = compute_hmac(source_file, self.hmac_key)
-                if computed_hmac != stored_hmac:
-                    logger.error(f"HMAC verification failed for {vault_file}")
-                    logger.debug(f"  Stored HMAC:   {stored_hmac}")
-                    logger.debug(f"  Computed HMAC: {computed_hmac}")
-                    logger.warning("File may have been tampered with - removing decrypted file")
-
-                    # Delete the potentially corrupted decrypted file
-                    if source_file.exists():
-                        try:
-                            source_file.unlink()
-                            logger.debug(f"Removed potentially corrupted file: {source_file}")
-                        except OSError as cleanup_err:
-                            logger.warning(f"Failed to remove corrupted file {source_file}: {cleanup_err}")
-
-                    errors.append((str(vault_file), "HMAC verification failed"))
-                    failed += 1
-                    continue
-
-                logger.info(f"Successfully restored {source_file} from {vault_file} (HMAC verified ✓)")
-                succeeded += 1
-
-            except (IOError, OSError, ValueError) as e:
-                logger.error(f"Failed to decrypt {vault_file}: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
-                errors.append((str(vault_file), f"Decryption failed: {e}"))
-                failed += 1
-
-                # Clean up partial output
-                if source_file.exists():
-                    try:
-                        source_file.unlink()
-                        logger.debug(f"Cleaned up partial file: {source_file}")
-                    except OSError as cleanup_err:
-                        logger.warning(f"Failed to cleanup {source_file}: {cleanup_err}")
-            finally:
-                # Clean up temp file
-                if Path(temp_path).exists():
-                    try:
-                        os.remove(temp_path)
-                        logger.debug(f"Removed temp file: {temp_path}")
-                    except OSError as cleanup_err:
-                        logger.warning(f"Failed to remove temp file {temp_path}: {cleanup_err}")
+        total = len(vault_files)
+        logger.info(f"Found {total} vault files to process")
+
+        results = self._map_files(lambda vault_file: self._refresh_one(vault_file, force), vault_files)
+        for vault_file, (status, error) in zip(vault_files, results):
+            counts[status] += 1
+            if error is not None:
+                errors.append((str(vault_file), error))
+        succeeded, failed, skipped = counts['succeeded'], counts['failed'], counts['skipped']
+        # Restored sources changed the tree; don't trust the cached walk
+        self._invalidate_scan()
 
         # Log summary
         logger.info(f"Refresh completed: {succeeded}/{total} succeeded, {failed} failed, {skipped} skipped")
@@ -662,6 +875,89 @@ class VaultTool:
             'errors': errors
         }
 
+    def _refresh_one(self, vault_file: Path, force: bool) -> Tuple[str, Optional[str]]:
+        """Restore one source file from its vault file if needed.
+
+        Args:
+            vault_file: Path to the vault file.
+            force: Restore even if the source file already exists.
+
+        Returns:
+            Tuple of (status, error_message) where status is one of 'succeeded',
+            'skipped' or 'failed'; error_message is None unless failed.
+        """
+        # Determine which suffix this vault file uses
+        # When fallback is enabled, files might have different suffixes
+        if str(vault_file).endswith(self.suffix):
+            vault_suffix = self.suffix
+        elif self.use_suffix_fallback and str(vault_file).endswith(".vault"):
+            vault_suffix = ".vault"
+        else:
+            # Unknown suffix, skip
+            logger.warning("Vault file %s doesn't match any known suffix pattern", vault_file)
+            return 'skipped', None
+
+        source_file = Path(self.source_filename(str(vault_file), vault_suffix))
+
+        if source_file.exists() and not force:
+            logger.debug("Skipping existing source file: %s", source_file)
+            return 'skipped', None
+
+        # Read vault file with validation
+        try:
+            logger.debug("Reading vault file: %s", vault_file)
+            with open(vault_file, "r", encoding="utf-8") as vf:
+                lines = vf.readlines()
+                if len(lines) < 2:
+                    raise ValueError("Vault file has insufficient lines (expected at least 2)")
+                stored_hmac = lines[0].strip()
+                encrypted_b64 = lines[1].strip()
+        except (IOError, OSError) as e:
+            logger.error("Failed to read vault file %s: %s", vault_file, e)
+            return 'failed', f"Read error: {e}"
+        except ValueError as e:
+            logger.warning("Malformed vault file %s: %s", vault_file, e)
+            return 'failed', f"Malformed: {e}"
+
+        # Validate HMAC format
+        if not self._is_valid_hmac(stored_hmac):
+            logger.error("Invalid HMAC format in %s (expected 64 hex chars)", vault_file)
+            return 'failed', "Invalid HMAC format"
+
+        # Validate and decode base64
+        if not encrypted_b64:
+            logger.error("Empty encrypted content in %s", vault_file)
+            return 'failed', "Empty encrypted content"
+
+        try:
+            encrypted_data = base64.b64decode(encrypted_b64, validate=True)
+        except (binascii.Error, ValueError) as e:
+            logger.error("Invalid base64 encoding in %s: %s", vault_file, e)
+            return 'failed', f"Base64 decode error: {e}"
+
+        # Decrypt in memory and verify before anything touches disk
+        try:
+            logger.debug("Decrypting %s -> %s", vault_file, source_file)
+            plaintext = self._decrypt_bytes(encrypted_data)
+
+            # CRITICAL: Verify HMAC of the decrypted content
+            computed_hmac = hmac.new(self.hmac_key, plaintext, hashlib.sha256).hexdigest()
+            if computed_hmac != stored_hmac:
+                logger.error("HMAC verification failed for %s", vault_file)
+                logger.debug("  Stored HMAC:   %s", stored_hmac)
+                logger.debug("  Computed HMAC: %s", computed_hmac)
+                logger.warning("File may have been tampered with - not restoring it")
+                return 'failed', "HMAC verification failed"
+
+            write_private_file(source_file, plaintext)
+
+            logger.info("Successfully restored %s from %s (HMAC verified ✓)", source_file, vault_file)
+            return 'succeeded', None
+
+        except (IOError, OSError, ValueError) as e:
+            logger.error("Failed to decrypt %s: %s", vault_file, e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            return 'failed', f"Decryption failed: {e}"
+
     def encrypt_task(self, force: bool = False) -> Dict[str, Any]:
         """Encrypt all source files to their corresponding vault files.
 
@@ -688,112 +984,23 @@ class VaultTool:
         logger.info(f"Starting encrypt task (force={force})")
 
         # Initialize counters for aggregation
-        total = 0
-        created = 0
-        updated = 0
-        skipped = 0
-        failed = 0
+        counts = {'created': 0, 'updated': 0, 'skipped': 0, 'failed': 0}
         errors = []
 
         source_files = list(self.iter_source_files())
-        logger.info(f"Found {len(source_files)} source files to process")
-
-        for source_file in source_files:
-            total += 1
-            # Determine vault filename using configured suffix
-            vault_file = Path(self.vault_filename(str(source_file)))
-
-            try:
-                # Compute HMAC of current source file
-                logger.debug(f"Computing HMAC for {source_file}")
-                hmac_tag = compute_hmac(source_file, self.hmac_key)
-
-                # Check if vault file exists and get its HMAC
-                vault_hmac = None
-                vault_exists = vault_file.exists()
-
-                if vault_exists:
-                    try:
-                        with open(vault_file, "r", encoding="utf-8") as vf:
-                            first_line = vf.readline().strip()
-                            vault_hmac = first_line if first_line else None
-                    except (IOError, OSError) as e:
-                        logger.warning(f"Failed to read existing vault file {vault_file}: {e}")
-                        vault_hmac = None
-
-                # Decide if encryption is needed
-                if vault_exists and hmac_tag == vault_hmac and not force:
-                    logger.debug(f"Skipping unchanged file: {source_file}")
-                    skipped += 1
-                    continue
-
-                # Encrypt file to temp, then encode and write .vault file
-                logger.debug(f"Encrypting {source_file} -> {vault_file}")
-                temp_encrypted = str(vault_file) + ".tmp"
-
-                try:
-                    self.encrypt_file(str(source_file), temp_encrypted)
-
-                    with open(temp_encrypted, "rb") as ef:
-                        encoded = encode_base64(ef.read()).decode()
+        total = len(source_files)
+        logger.info(f"Found {total} source files to process")
 
-                    # Calculate expected size for validation
-                    expected_content = hmac_tag + "\n" + encoded + "\n"
-                    expected_size = len(expected_content.encode('utf-8'))
+        results = self._map_files(lambda source_file: self._encrypt_one(source_file, force), source_files)
+        for source_file, (status, error) in zip(source_files, results):
+            counts[status] += 1
+            if error is not None:
+                errors.append((str(source_file), error))
+        created, updated, skipped, failed = counts['created'], counts['updated'], counts['skipped'], counts['failed']
+        self._invalidate_scan()
 
-                    # Write vault file with HMAC and encrypted content
-                    logger.debug(f"Writing vault file: {vault_file} ({expected_size} bytes)")
-                    with open(vault_file, "w", encoding="utf-8") as vf:
-                        vf.write(expected_content)
-                        vf.flush()
-                        # Force write to disk to ensure data is persisted
-                        os.fsync(vf.fileno())
-
-                    # Verify the file was written correctly
-                    if not vault_file.exists():
-                        raise IOError(f"Vault file not created after write: {vault_file}")
-
-                    # Verify file size matches expected
-                    written_size = vault_file.stat().st_size
-                    if written_size != expected_size:
-                        logger.error(f"Incomplete write to {vault_file}: {written_size} bytes (expected {expected_size})")
-                        raise IOError(f"Incomplete write: {written_size} bytes written, expected {expected_size} bytes")
-
-                    # Verify file is readable and contains valid data
-                    try:
-                        with open(vault_file, "r", encoding="utf-8") as vf_verify:
-                            verify_lines = vf_verify.readlines()
-                            if len(verify_lines) < 2:
-                                raise IOError("Vault file verification failed: insufficient lines")
-                            if verify_lines[0].strip() != hmac_tag:
-                                raise IOError("Vault file verification failed: HMAC mismatch")
-                    except (IOError, OSError, UnicodeDecodeError) as verify_err:
-                        logger.error(f"Vault file verification failed for {vault_file}: {verify_err}")
-                        raise IOError(f"Vault file verification failed: {verify_err}")
-
-                    action = "Updated" if vault_exists else "Created"
-                    logger.info(f"{action} vault file: {vault_file} for source: {source_file} ({written_size} bytes)")
-                    logger.debug("Vault file verified: HMAC correct, size correct")
-
-                    if vault_exists:
-                        updated += 1
-                    else:
-                        created += 1
-
-                finally:
-                    # Clean up temp file
-                    if Path(temp_encrypted).exists():
-                        try:
-                            os.remove(temp_encrypted)
-                            logger.debug(f"Removed temp file: {temp_encrypted}")
-                        except OSError as cleanup_err:
-                            logger.warning(f"Failed to remove temp file {temp_encrypted}: {cleanup_err}")
-
-            except (IOError, OSError, ValueError) as e:
-                logger.error(f"Failed to encrypt {source_file}: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
-                errors.append((str(source_file), f"Encryption failed: {e}"))
-                failed += 1
-                continue
+        if self._hmac_cache is not None:
+            self._hmac_cache.save()
 
         # Log summary
         logger.info(f"Encrypt completed: {created} created, {updated} updated, {skipped} skipped, {failed} failed (total: {total})")
@@ -813,6 +1020,118 @@ class VaultTool:
             'errors': errors
         }
 
+    def _vault_hmac(self, vault_file: Path) -> Tuple[bool, Optional[str]]:
+        """Return whether a vault file exists and the HMAC stored on its first line.
+
+        The stored HMAC is kept in the HMAC cache under the vault's own stat
+        stamp, so an unchanged vault is not reopened on the next run.
+
+        Args:
+            vault_file: Path to the vault file.
+
+        Returns:
+            Tuple of (exists, stored_hmac); stored_hmac is None if the vault is
+            missing, unreadable or has an empty first line.
+        """
+        try:
+            vault_st = os.stat(vault_file)
+        except OSError:
+            return False, None
+
+        if self._hmac_cache is not None:
+            cached = self._hmac_cache.get(vault_file, vault_st)
+            if cached is not None:
+                return True, cached
+
+        try:
+            with open(vault_file, "r", encoding="utf-8") as vf:
+                first_line = vf.readline().strip()
+        except (IOError, OSError) as e:
+            logger.warning("Failed to read existing vault file %s: %s", vault_file, e)
+            return True, None
+
+        if not first_line:
+            return True, None
+        if self._hmac_cache is not None:
+            self._hmac_cache.record(vault_file, first_line, vault_st)
+        return True, first_line
+
+    def _encrypt_one(self, source_file: Path, force: bool) -> Tuple[str, Optional[str]]:
+        """Encrypt one source file to its vault file if needed.
+
+        Args:
+            source_file: Path to the source file.
+            force: Re-encrypt even if the stored HMAC matches.
+
+        Returns:
+            Tuple of (status, error_message) where status is one of 'created',
+            'updated', 'skipped' or 'failed'; error_message is None unless failed.
+        """
+        # Determine vault filename using configured suffix
+        vault_file = Path(self.vault_filename(str(source_file)))
+
+        try:
+            # Check if vault file exists and get its HMAC
+            vault_exists, vault_hmac = self._vault_hmac(vault_file)
+
+            # An unchanged stat stamp lets us skip without reading the source at all
+            st = os.stat(source_file)
+            # (a vault without a readable HMAC line is never up to date)
+            if self._hmac_cache is not None and vault_hmac is not None and not force:
+                if self._hmac_cache.get(source_file, st) == vault_hmac:
+                    logger.debug("Skipping unchanged file (HMAC cache hit): %s", source_file)
+                    return 'skipped', None
+
+            # One read of the source feeds both the HMAC and the cipher
+            with self._open_source(str(source_file)) as plaintext:
+                logger.debug("Computing HMAC for %s", source_file)
+                hmac_tag = hmac.new(self.hmac_key, plaintext, hashlib.sha256).hexdigest()
+                if self._hmac_cache is not None:
+                    self._hmac_cache.record(source_file, hmac_tag, st)
+
+                # Decide if encryption is needed
+                if vault_exists and hmac_tag == vault_hmac and not force:
+                    logger.debug("Skipping unchanged file: %s", source_file)
+                    return 'skipped', None
+
+                # Line 1: HMAC, line 2: base64(IV + ciphertext), encrypted and
+                # encoded chunk by chunk so neither is held in memory whole.
+                # The vault is only replaced once the new content has been verified,
+                # so a failed or interrupted run never leaves a truncated vault behind.
+                logger.debug("Encrypting %s -> %s", source_file, vault_file)
+                hmac_line = hmac_tag.encode("ascii") + b"\n"
+                with atomic_file(vault_file) as vf:
+                    expected_size = vf.write(hmac_line)
+                    for encoded in iter_base64(self._iter_encrypted(plaintext)):
+                        expected_size += vf.write(encoded)
+                    expected_size += vf.write(b"\n")
+                    vf.flush()
+
+                    # Verify file size matches expected
+                    written_size = os.fstat(vf.fileno()).st_size
+                    if written_size != expected_size:
+                        logger.error("Incomplete write to %s: %d bytes (expected %d)", vault_file, written_size, expected_size)
+                        raise IOError(f"Incomplete write: {written_size} bytes written, expected {expected_size} bytes")
+
+                    # Verify the stored HMAC reads back (size already covers the payload)
+                    try:
+                        vf.seek(0)
+                        if vf.readline() != hmac_line:
+                            raise IOError("Vault file verification failed: HMAC mismatch")
+                    except (IOError, OSError) as verify_err:
+                        logger.error("Vault file verification failed for %s: %s", vault_file, verify_err)
+                        raise IOError(f"Vault file verification failed: {verify_err}")
+                logger.debug("Wrote vault file: %s (%s bytes)", vault_file, expected_size)
+
+            action = "Updated" if vault_exists else "Created"
+            logger.info("%s vault file: %s for source: %s (%s bytes)", action, vault_file, source_file, written_size)
+            logger.debug("Vault file verified: HMAC correct, size correct")
+
+            return ('updated' if vault_exists else 'created'), None
+
+        except (IOError, OSError, ValueError) as e:
+            logger.error("Failed to encrypt %s: %s", source_file, e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            return 'failed', f"Encryption failed: {e}"
 
     def remove_task(self) -> Dict[str, Any]:
         """Delete all vault files matching the configured suffix.
@@ -836,47 +1155,30 @@ class VaultTool:
         """
         logger.info("Starting remove task")
 
-        # Initialize counters for aggregation
-        total = 0
-        removed = 0
-        failed = 0
         errors = []
 
         # Collect all vault files to remove (including both custom suffix and fallback .vault files)
-        vault_files_to_remove = set()
-
         if self.use_suffix_fallback and self.suffix != ".vault":
             # When suffix fallback is enabled, remove BOTH custom suffix and .vault files
             logger.info(f"Collecting vault files with custom suffix '{self.suffix}' and fallback '.vault' files")
-            for dir in self.include_directories:
-                # Find files with custom suffix
-                for vault_file in Path(dir).rglob(f"*{self.suffix}"):
-                    vault_files_to_remove.add(vault_file)
-
-                # Find files with .vault suffix (fallback files)
-                for vault_file in Path(dir).rglob("*.vault"):
-                    # Skip if this file matches the custom suffix pattern (avoid duplicates)
-                    if not str(vault_file).endswith(self.suffix):
-                        vault_files_to_remove.add(vault_file)
         else:
             # Traditional behavior: collect all vault files with configured suffix
             logger.info(f"Collecting vault files with suffix '{self.suffix}'")
-            for dir in self.include_directories:
-                for vault_file in Path(dir).rglob(f"*{self.suffix}"):
-                    vault_files_to_remove.add(vault_file)
 
-        logger.info(f"Found {len(vault_files_to_remove)} vault files to remove")
-
-        for vault_file in vault_files_to_remove:
-            total += 1
-            try:
-                vault_file.unlink()
-                logger.info(f"Removed vault file: {vault_file}")
-                removed += 1
-            except (IOError, OSError, PermissionError) as e:
-                logger.error(f"Failed to remove {vault_file}: {e}")
-                errors.append((str(vault_file), f"Remove failed: {e}"))
-                failed += 1
+        # The scan already collects both kinds when fallback applies, and scandir
+        # told us these are files; unlink the paths directly. Normalized and
+        # deduplicated so overlapping include directories don't repeat files.
+        _, vault_paths = self._scan()
+        vault_files = list(dict.fromkeys(os.path.normpath(p) for p in vault_paths))
+        total = len(vault_files)
+        logger.info(f"Found {total} vault files to remove")
+
+        for vault_file, error in zip(vault_files, self._map_files(self._remove_one, vault_files)):
+            if error is not None:
+                errors.append((vault_file, error))
+        failed = len(errors)
+        removed = total - failed
+        self._invalidate_scan()
 
         # Log summary
         logger.info(f"Remove completed: {removed}/{total} removed, {failed} failed")
@@ -893,3 +1195,20 @@ class VaultTool:
             'failed': failed,
             'errors': errors
         }
+
+    def _remove_one(self, vault_file: str) -> Optional[str]:
+        """Delete one vault file.
+
+        Args:
+            vault_file: Path to the vault file.
+
+        Returns:
+            None on success, otherwise the error message.
+        """
+        try:
+            os.unlink(vault_file)
+        except OSError as e:
+            logger.error(f"Failed to remove {vault_file}: {e}")
+            return f"Remove failed: {e}"
+        logger.info("Removed vault file: %s", vault_file)
+        return None
@@ -0,0 +1,28 @@
+"""Stat-stamp helpers shared by VaultTool's file caches.
+
+Kept free of heavy imports so config loading can use it without pulling in
+cryptography.
+"""
+
+import os
+import time
+
+# Files modified this recently are not cached: a later write within the same
+# timestamp granularity could leave (mtime, size) unchanged ("racily clean").
+RACY_WINDOW_NS: int = 2 * 1_000_000_000
+
+
+def stat_is_racy(st: os.stat_result) -> bool:
+    """Return True if a file was modified too recently to trust its stat stamp.
+
+    A same-size rewrite within one filesystem timestamp tick leaves
+    (mtime, size) unchanged, so caches keyed on the stamp must not record
+    files modified within the last couple of seconds.
+
+    Args:
+        st: Result of ``os.stat`` for the file.
+
+    Returns:
+        True if ``st_mtime_ns`` is within the racy window of the current time.
+    """
+    return time.time_ns() - st.st_mtime_ns < RACY_WINDOW_NS
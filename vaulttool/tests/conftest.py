@@ -1,7 +1,10 @@
 """Pytest configuration and fixtures for vaulttool tests."""
 
 import os
+from pathlib import Path
+
 import pytest
+import yaml
 
 
 @pytest.fixture(autouse=True)
@@ -27,3 +30,49 @@ def preserve_cwd():
                 os.chdir(parent)
             else:
                 os.chdir(os.path.expanduser("~"))
+
+
+@pytest.fixture(autouse=True)
+def fresh_vaulttool():
+    """Drop the shared VaultTool instance so no test sees another test's config."""
+    from vaulttool import get_vaulttool
+
+    get_vaulttool.cache_clear()
+    yield
+    get_vaulttool.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def vault_key_file(tmp_path_factory):
+    """Key file shared by every test in the session (tests only ever read it)."""
+    key_path = tmp_path_factory.mktemp("vault") / "keyfile"
+    key_path.write_bytes(b"test_key_12345678901234567890")
+    return key_path
+
+
+@pytest.fixture
+def write_config():
+    """Return a helper that writes a .vaulttool.yml into a directory.
+
+    The defaults include '*.env' files below '.' with the '.vault' suffix.
+    Keyword overrides replace a top-level list (include_directories,
+    exclude_directories, include_patterns, exclude_patterns) or set an option.
+    """
+    def write(directory, key_file, **overrides):
+        config = {
+            "include_directories": ["."],
+            "exclude_directories": [],
+            "include_patterns": ["*.env"],
+            "exclude_patterns": [],
+            "options": {"suffix": ".vault", "key_file": str(key_file)},
+        }
+        for key, value in overrides.items():
+            if key in config:
+                config[key] = value
+            else:
+                config["options"][key] = value
+        path = Path(directory) / ".vaulttool.yml"
+        path.write_text(yaml.safe_dump({"vaulttool": config}))
+        return path
+
+    return write
@@ -23,3 +23,39 @@ vaulttool:
         assert config["include_directories"] == ['testdir']
         assert config["options"]["algorithm"] == "aes-256-cbc"
     os.unlink(tf.name)
+
+
+def test_load_config_reuses_parsed_yaml_until_file_changes():
+    from vaulttool import config as config_module
+
+    config_yaml = '''
+vaulttool:
+  include_directories: ['testdir']
+  exclude_directories: []
+  include_patterns: ['*.env']
+  exclude_patterns: []
+  options:
+    suffix: ".vault"
+    key_file: "keyfile"
+'''
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, ".vaulttool.yml")
+        with open(path, "w") as cf:
+            cf.write(config_yaml)
+        # Age the file past the racy-timestamp window so it may be cached
+        old = os.stat(path).st_mtime_ns - 10 * 1_000_000_000
+        os.utime(path, ns=(old, old))
+
+        first = load_config(path)
+        # Mutating the returned config must not leak into the next call
+        first["include_patterns"].append("*.secret")
+        second = load_config(path)
+        assert second["include_patterns"] == ['*.env']
+
+        assert os.path.realpath(path) in {str(p) for p in config_module._CONFIG_CACHE}
+
+        # Editing the file invalidates the cached parse, even at the same size
+        with open(path, "w") as cf:
+            cf.write(config_yaml.replace("testdir", "tstdir2"))
+        third = load_config(path)
+        assert third["include_directories"] == ['tstdir2']
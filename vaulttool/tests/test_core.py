@@ -1,3 +1,4 @@
+import base64
 import tempfile
 import os
 import pytest
@@ -66,6 +67,7 @@ def test_source_filename_static_method():
     # Test with vault file
     assert VaultTool.source_filename("config.env.vault", ".vault") == "config.env"
     assert VaultTool.source_filename("secrets/api.key.vault", ".vault") == "secrets/api.key"
+    assert VaultTool.source_filename("config.env", "") == "config.env"
     
     # Test with non-vault file
     assert VaultTool.source_filename("config.env", ".vault") == "config.env"
@@ -463,16 +465,11 @@ vaulttool:
             assert not Path(".gitignore").exists()
 
 
-def test_remove_vault_files():
+def test_remove_vault_files(vault_key_file):
     """Test the remove_vault_files method."""
     with tempfile.TemporaryDirectory() as tmpdir:
         os.chdir(tmpdir)
 
-        # Create a key file
-        key_path = os.path.join(tmpdir, "keyfile")
-        with open(key_path, "wb") as kf:
-            kf.write(b"test_key_12345678901234567890")
-        
         # Create test vault files
         vault1 = Path(tmpdir) / "config.env.vault"
         vault2 = Path(tmpdir) / "secrets.txt.vault"
@@ -490,7 +487,7 @@ vaulttool:
   exclude_patterns: []
   options:
     suffix: ".vault"
-    key_file: "{key_path}"
+    key_file: "{vault_key_file}"
 """
         with open(".vaulttool.yml", "w") as cf:
             cf.write(config_yaml)
@@ -505,6 +502,21 @@ vaulttool:
         assert not_vault.exists()
 
 
+def test_remove_task_overlapping_include_directories(tmp_path, vault_key_file, write_config):
+    """Test a vault file reachable from two include directories is removed once."""
+    os.chdir(tmp_path)
+    (tmp_path / "sub").mkdir()
+    vault = tmp_path / "sub" / "a.env.vault"
+    vault.touch()
+    write_config(tmp_path, vault_key_file, include_directories=[".", "./sub", "sub"])
+
+    result = VaultTool().remove_task()
+    assert result['total'] == 1
+    assert result['removed'] == 1
+    assert result['failed'] == 0
+    assert not vault.exists()
+
+
 def test_validate_gitignore():
     """Test the validate_gitignore method."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -670,3 +682,264 @@ vaulttool:
         # Should only include .env file, excluding .log, .txt, and .yml files
         assert len(source_files) == 1
         assert source_files[0].name == "config.env"
+
+
+def test_exclude_patterns_with_directory_component(tmp_path, vault_key_file, write_config):
+    """Test exclude patterns containing a path separator match trailing path components."""
+    os.chdir(tmp_path)
+
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "top.env").touch()
+    (tmp_path / "sub" / "nested.env").touch()
+    (tmp_path / "sub" / "local.example.env").touch()
+
+    write_config(tmp_path, vault_key_file, include_directories=[str(tmp_path)],
+                 exclude_patterns=["sub/nested.env", "*example*"])
+
+    vt = VaultTool()
+    names = sorted(p.name for p in vt.iter_source_files())
+    assert names == ["top.env"]
+
+
+def test_iter_source_files_single_walk_semantics(tmp_path, vault_key_file, write_config):
+    """Test include/exclude handling of the scandir-based source walk."""
+    os.chdir(tmp_path)
+    for rel in ["a.env", "b.secret", "config/c.env", "build/d.env", "deep/build/e.env",
+                ".vaulttool-cache/f.env", "dir.env/g.txt", "x+y/h.env", "xxy/i.env"]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+
+    write_config(tmp_path, vault_key_file, exclude_directories=["build", "x+y"],
+                 include_patterns=["*.env", "*.secret", "config/*.env"])
+
+    vt = VaultTool()
+    found = sorted(str(p) for p in vt.iter_source_files())
+    # Each file once, even when matched by several patterns; directories
+    # named like a pattern are not sources; files under excluded directories
+    # are filtered out and the cache dir is pruned.
+    assert found == ["a.env", "b.secret", os.path.join("config", "c.env"), os.path.join("xxy", "i.env")]
+
+
+def test_source_and_vault_files_share_one_walk(tmp_path, vault_key_file, write_config):
+    """Test source and vault listings reuse one walk until a directory changes."""
+    from vaulttool.utils import walk_files
+
+    os.chdir(tmp_path)
+    write_config(tmp_path, vault_key_file)
+    # Appending to an existing .gitignore leaves the directory stamp alone
+    (tmp_path / ".gitignore").write_text("")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "a.env").touch()
+    (tmp_path / "sub" / "b.env.vault").touch()
+    old = 1_600_000_000
+    for directory in (tmp_path, tmp_path / "sub"):
+        os.utime(directory, (old, old))
+
+    vt = VaultTool()
+    with patch("vaulttool.core.walk_files", wraps=walk_files) as walked:
+        assert [p.name for p in vt.iter_source_files()] == ["a.env"]
+        assert [p.name for p in vt.iter_vault_files()] == ["b.env.vault"]
+        assert walked.call_count == 1
+
+        # A new file bumps its directory's mtime, so the tree is walked again
+        (tmp_path / "sub" / "c.env").touch()
+        assert sorted(p.name for p in vt.iter_source_files()) == ["a.env", "c.env"]
+        assert walked.call_count == 2
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_encrypt_and_refresh_many_files_concurrently(tmp_path, concurrency, vault_key_file, write_config):
+    """Test encrypt_task results are complete and ordered for serial and parallel runs."""
+    os.chdir(tmp_path)
+    write_config(tmp_path, vault_key_file, concurrency=concurrency)
+    contents = {f"file{i}.env": f"SECRET_{i}={'x' * i}" for i in range(12)}
+    for name, content in contents.items():
+        (tmp_path / name).write_text(content)
+
+    vt = VaultTool()
+    assert vt.concurrency == concurrency
+    result = vt.encrypt_task()
+    assert result['total'] == 12
+    assert result['created'] == 12
+    assert result['failed'] == 0
+
+    for name in contents:
+        (tmp_path / name).unlink()
+    result = vt.refresh_task()
+    assert result['succeeded'] == 12
+    for name, content in contents.items():
+        assert (tmp_path / name).read_text() == content
+
+    result = vt.remove_task()
+    assert result['removed'] == 12
+    assert result['failed'] == 0
+    assert not list(tmp_path.glob("*.vault"))
+
+
+def test_refresh_hmac_mismatch_keeps_existing_source(tmp_path, vault_key_file, write_config):
+    """Test a vault failing HMAC verification never overwrites the source or leaves temp files."""
+    os.chdir(tmp_path)
+    write_config(tmp_path, vault_key_file)
+    source = tmp_path / "secret.env"
+    source.write_text("SECRET=original")
+
+    vt = VaultTool()
+    vt.encrypt_task()
+    vault = tmp_path / "secret.env.vault"
+    lines = vault.read_text().splitlines()
+    vault.write_text("0" * 64 + "\n" + lines[1] + "\n")
+    source.write_text("SECRET=local-edit")
+
+    result = vt.refresh_task(force=True)
+    assert result['failed'] == 1
+    assert result['errors'][0][1] == "HMAC verification failed"
+    assert source.read_text() == "SECRET=local-edit"
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+@pytest.mark.parametrize("damage", ["wrong_key", "corrupt_ciphertext"])
+def test_refresh_decrypt_failure_keeps_existing_source(tmp_path, vault_key_file, write_config, damage):
+    """Test a vault that fails to decrypt never deletes or truncates the existing source."""
+    os.chdir(tmp_path)
+    write_config(tmp_path, vault_key_file)
+    source = tmp_path / "secret.env"
+    source.write_text("SECRET=original")
+    VaultTool().encrypt_task()
+
+    vault = tmp_path / "secret.env.vault"
+    if damage == "wrong_key":
+        other_key = tmp_path / "other.key"
+        other_key.write_bytes(b"another_key_1234567890123456789")
+        write_config(tmp_path, other_key)
+    else:
+        hmac_line, encoded = vault.read_text().splitlines()
+        # Flip a byte in the last ciphertext block so the padding no longer checks out
+        data = bytearray(base64.b64decode(encoded))
+        data[-1] ^= 0xFF
+        vault.write_text(hmac_line + "\n" + base64.b64encode(bytes(data)).decode() + "\n")
+
+    result = VaultTool().refresh_task(force=True)
+    assert result['failed'] == 1
+    assert source.read_text() == "SECRET=original"
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_failed_encrypt_keeps_existing_vault(tmp_path, vault_key_file, write_config):
+    """Test a re-encrypt that fails midway leaves the previous vault and no temp files."""
+    os.chdir(tmp_path)
+    write_config(tmp_path, vault_key_file)
+    source = tmp_path / "secret.env"
+    source.write_text("SECRET=1")
+    vt = VaultTool()
+    assert vt.encrypt_task()['created'] == 1
+    vault = tmp_path / "secret.env.vault"
+    previous = vault.read_bytes()
+
+    def broken_stream(plaintext):
+        yield b"\0" * 16
+        raise OSError("disk full")
+
+    source.write_text("SECRET=2")
+    with patch.object(vt, "_iter_encrypted", side_effect=broken_stream):
+        assert vt.encrypt_task(force=True)['failed'] == 1
+    assert vault.read_bytes() == previous
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+@pytest.mark.parametrize("vault_content", [b"", b"\nAAAA\n"])
+def test_encrypt_repairs_vault_without_hmac_line(tmp_path, vault_key_file, write_config, vault_content):
+    """Test an empty or truncated vault is rewritten, not skipped as unchanged."""
+    os.chdir(tmp_path)
+    write_config(tmp_path, vault_key_file)
+    (tmp_path / "secret.env").write_text("SECRET=1")
+    vault = tmp_path / "secret.env.vault"
+    vault.write_bytes(vault_content)
+
+    assert VaultTool().encrypt_task()['updated'] == 1
+    hmac_line = vault.read_text().splitlines()[0]
+    assert len(hmac_line) == 64
+
+
+def test_validate_file_path_rejects_symlinks_and_outside_paths(tmp_path, vault_key_file, write_config):
+    """Test path validation rejects symlinks (even dangling ones) and paths outside cwd."""
+    os.chdir(tmp_path)
+    write_config(tmp_path, vault_key_file)
+    target = tmp_path / "real.env"
+    target.write_text("A=1")
+    (tmp_path / "link.env").symlink_to(target)
+    (tmp_path / "dangling.env").symlink_to(tmp_path / "missing.env")
+
+    vt = VaultTool()
+    assert vt._validate_file_path("real.env") == target.resolve()
+    with pytest.raises(ValueError, match="Symlinks not allowed"):
+        vt._validate_file_path("link.env")
+    with pytest.raises(ValueError, match="Symlinks not allowed"):
+        vt._validate_file_path("dangling.env", require_exists=False)
+    with pytest.raises(ValueError, match="outside working directory"):
+        vt._validate_file_path(str(vault_key_file))
+    with pytest.raises(ValueError, match="not a regular file"):
+        vt._validate_file_path(".", require_exists=False)
+
+
+def test_encrypt_reads_each_source_once_and_skips_cached(tmp_path, vault_key_file, write_config):
+    """Test encrypt hashes and encrypts from one read, and cache hits skip reading."""
+    os.chdir(tmp_path)
+    write_config(tmp_path, vault_key_file)
+    source = tmp_path / "secret.env"
+    source.write_text("SECRET=1")
+    old = 1_600_000_000
+    os.utime(source, (old, old))
+
+    vt = VaultTool()
+    with patch.object(VaultTool, "_open_source", wraps=vt._open_source) as opened:
+        assert vt.encrypt_task()['created'] == 1
+        assert opened.call_count == 1
+
+    vt = VaultTool()
+    with patch.object(VaultTool, "_open_source", wraps=vt._open_source) as opened:
+        assert vt.encrypt_task()['skipped'] == 1
+        assert opened.call_count == 0
+
+    # Once the vault's stamp is cached too, a no-op run opens neither file
+    vault = tmp_path / "secret.env.vault"
+    os.utime(vault, (old, old))
+    assert VaultTool().encrypt_task()['skipped'] == 1
+    vt = VaultTool()
+    real_open = open
+    with patch("builtins.open", side_effect=real_open) as opened:
+        assert vt.encrypt_task()['skipped'] == 1
+    assert not [c for c in opened.call_args_list if str(c.args[0]).endswith(("secret.env", ".vault"))]
+
+    source.write_text("SECRET=2")
+    with patch.object(VaultTool, "_open_source", wraps=vt._open_source) as opened:
+        assert vt.encrypt_task()['updated'] == 1
+        assert opened.call_count == 1
+
+
+def test_encrypt_and_refresh_multi_chunk_file(tmp_path, vault_key_file, write_config):
+    """Test a source spanning several encryption chunks round-trips through its vault."""
+    from vaulttool.core import ENCRYPT_CHUNK_SIZE
+
+    os.chdir(tmp_path)
+    write_config(tmp_path, vault_key_file, include_patterns=["*.bin"])
+    data = os.urandom(ENCRYPT_CHUNK_SIZE * 2 + 12345)
+    source = tmp_path / "big.bin"
+    source.write_bytes(data)
+
+    vt = VaultTool()
+    assert vt.encrypt_task()['created'] == 1
+    hmac_line, b64_line = (tmp_path / "big.bin.vault").read_bytes().split(b"\n")[:2]
+    assert len(base64.b64decode(b64_line, validate=True)) == 16 + (len(data) // 16 + 1) * 16
+
+    source.unlink()
+    assert vt.refresh_task()['succeeded'] == 1
+    assert source.read_bytes() == data
+
+
+def test_invalid_concurrency_rejected(tmp_path, vault_key_file, write_config):
+    """Test that a non-positive concurrency option is rejected."""
+    os.chdir(tmp_path)
+    write_config(tmp_path, vault_key_file, concurrency=0)
+    with pytest.raises(ValueError, match="concurrency"):
+        VaultTool()
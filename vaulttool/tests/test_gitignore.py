@@ -1,6 +1,7 @@
 import tempfile
 import os
 from pathlib import Path
+from unittest.mock import patch
 from vaulttool.core import VaultTool
 
 def test_source_added_to_gitignore():
@@ -45,3 +46,84 @@ vaulttool:
             lines = [line.strip() for line in gi if line.strip()]
         rel_path = os.path.relpath(plain_path, Path(tmpdir).absolute())
         assert rel_path in lines
+
+
+def test_gitignore_additions_are_batched(tmp_path, vault_key_file, write_config):
+    os.chdir(tmp_path)
+    write_config(tmp_path, vault_key_file)
+    (tmp_path / ".gitignore").write_text("already.env\n")
+    for name in ["already.env", "a.env", "b.env", "c.env"]:
+        (tmp_path / name).touch()
+
+    vt = VaultTool()
+    with patch.object(VaultTool, "flush_gitignore", wraps=vt.flush_gitignore) as flush:
+        assert len(list(vt.iter_source_files())) == 4
+        assert flush.call_count == 1
+
+    lines = (tmp_path / ".gitignore").read_text().splitlines()
+    assert lines[0] == "already.env"
+    assert sorted(lines[1:]) == ["a.env", "b.env", "c.env"]
+
+    # A second pass finds everything already listed
+    list(vt.iter_source_files())
+    assert len((tmp_path / ".gitignore").read_text().splitlines()) == 4
+
+
+def test_gitignore_entries_relative_to_startup_directory(tmp_path, vault_key_file, write_config):
+    os.chdir(tmp_path)
+    write_config(tmp_path, vault_key_file)
+    vt = VaultTool()
+    vt.add_to_gitignore(tmp_path / "sub" / "a.env")
+    vt.add_to_gitignore(Path("sub/a.env"))
+    vt.add_to_gitignore("./sub/../sub/a.env")
+    vt.add_to_gitignore("b.env")
+
+    lines = (tmp_path / ".gitignore").read_text().splitlines()
+    assert lines == [os.path.join("sub", "a.env"), "b.env"]
+
+
+def test_gitignore_parsed_once_while_unchanged(tmp_path, vault_key_file, write_config):
+    os.chdir(tmp_path)
+    write_config(tmp_path, vault_key_file)
+    gitignore = tmp_path / ".gitignore"
+    gitignore.write_text("a.env\n")
+    old = 1_600_000_000
+    os.utime(gitignore, (old, old))
+    (tmp_path / "a.env").touch()
+
+    def gitignore_reads(opened):
+        return [c for c in opened.call_args_list if str(c.args[0]).endswith(".gitignore")]
+
+    vt = VaultTool()
+    real_open = open
+    with patch("builtins.open", side_effect=real_open) as opened:
+        list(vt.iter_source_files())
+        list(vt.iter_source_files())
+    assert len(gitignore_reads(opened)) == 1
+
+    # An external edit is picked up on the next listing
+    gitignore.write_text("a.env\nb.env\n")
+    (tmp_path / "b.env").touch()
+    with patch("builtins.open", side_effect=real_open) as opened:
+        list(vt.iter_source_files())
+    assert len(gitignore_reads(opened)) == 1
+    assert gitignore.read_text().splitlines() == ["a.env", "b.env"]
+
+
+def test_precommit_check_runs_once_per_batch(tmp_path, vault_key_file, write_config):
+    """Test the pre-commit guard checks for .git once per listing, not per file."""
+    from vaulttool import core
+
+    os.chdir(tmp_path)
+    write_config(tmp_path, vault_key_file, exclude_directories=[".git"])
+    (tmp_path / ".git").mkdir()
+    for name in ("a.env", "b.env", "c.env"):
+        (tmp_path / name).touch()
+
+    vt = VaultTool()
+    real_exists = Path.exists
+    with patch.object(core, "VAULTTOOL_PRECOMMIT", True), \
+            patch.object(Path, "exists", autospec=True, side_effect=real_exists) as exists:
+        assert len(list(vt.iter_source_files())) == 3
+    assert [str(c.args[0]) for c in exists.call_args_list].count(".git") == 1
+    assert not (tmp_path / ".gitignore").exists()
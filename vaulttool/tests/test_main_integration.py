@@ -45,6 +45,7 @@ vaulttool:
         monkeypatch.chdir(tmpdir)
         result = runner.invoke(app, ["encrypt"])
         assert result.exit_code == 0
+        assert "Encrypt Summary:\n  Total:    1\n  Created:  1\n" in result.output
         # Check .vault file created
         vault_path = plain_path.with_suffix(plain_path.suffix + ".vault")
         assert vault_path.exists()
@@ -58,3 +59,28 @@ vaulttool:
         assert plain_path.exists()
         with open(plain_path) as pf:
             assert pf.read() == "SECRET=12345"
+
+
+def test_gen_vaulttool_outputs_valid_config():
+    import yaml
+    from typer.testing import CliRunner
+    from vaulttool.cli import app
+    runner = CliRunner()
+    result = runner.invoke(app, ["gen-vaulttool"])
+    assert result.exit_code == 0
+    assert result.output.startswith("---")
+    config = yaml.safe_load(result.output)["vaulttool"]
+    assert config["options"]["suffix"] == ".vault"
+
+
+def test_get_vaulttool_reuses_instance_per_directory(tmp_path, monkeypatch, vault_key_file, write_config):
+    from vaulttool import get_vaulttool
+
+    write_config(tmp_path, vault_key_file, include_directories=[str(tmp_path)])
+    monkeypatch.chdir(tmp_path)
+
+    vt = get_vaulttool()
+    assert get_vaulttool() is vt
+
+    get_vaulttool.cache_clear()
+    assert get_vaulttool() is not vt
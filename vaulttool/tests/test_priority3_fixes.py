@@ -65,13 +65,18 @@ class TestCLIErrorHandling:
     
     def test_get_version_handles_errors_gracefully(self):
         """Test _get_version() handles various errors without crashing."""
-        # Test with mocked exception in importlib
-        with patch('importlib.metadata.version', side_effect=Exception("test error")):
-            version = _get_version()
-            
-            # Should still return a version (fallback)
-            assert version is not None
-            assert isinstance(version, str)
+        # Test with mocked exception in importlib (bypass the per-process cache)
+        _get_version.cache_clear()
+        try:
+            with patch('importlib.metadata.version', side_effect=Exception("test error")):
+                version = _get_version()
+
+                # Should still return a version (fallback)
+                assert version is not None
+                assert isinstance(version, str)
+                assert not version.startswith("unknown")  # read from the repository pyproject.toml
+        finally:
+            _get_version.cache_clear()
 
 
 class TestPathValidationContext:
@@ -158,7 +163,7 @@ class TestCryptoOperationValidation:
             
             # Verify validation code exists
             import inspect
-            source = inspect.getsource(vt.encrypt_file)
+            source = inspect.getsource(vt._encrypt_data)
             assert "suspiciously small" in source.lower() or "encrypted_size" in source.lower()
             assert "< 32" in source or "minimum" in source.lower()
     
@@ -358,3 +363,19 @@ class TestIntegratedErrorHandling:
             assert decrypted.read_text() == "Sensitive data"
 
 
+class TestLoggingSetup:
+    """Test setup_logging() reconfiguration."""
+
+    def test_setup_logging_reuses_console_handler(self):
+        """Test repeated setup_logging() calls swap level/format on one handler."""
+        logger = setup_logging(level=logging.INFO, include_timestamp=True)
+        handler = logger.handlers[0]
+        ts_formatter = handler.formatter
+
+        logger = setup_logging(level=logging.ERROR, include_timestamp=False)
+        assert logger.handlers == [handler]
+        assert handler.level == logging.ERROR
+        assert handler.formatter is not ts_formatter
+
+        setup_logging(level=logging.INFO, include_timestamp=True)
+        assert handler.formatter is ts_formatter
@@ -1,5 +1,6 @@
 import tempfile
 import os
+import pytest
 from vaulttool.utils import compute_checksum, encode_base64, compute_hmac, derive_keys
 
 def test_compute_checksum_and_base64():
@@ -77,3 +78,158 @@ def test_compute_hmac():
         os.unlink(test_file)
         os.unlink(key_file)
 
+
+def test_hmac_cache_skips_rehash_until_file_changes(tmp_path):
+    """Test HmacCache returns stored HMACs only while the stat stamp matches."""
+    from vaulttool.utils import HmacCache
+
+    key_file = tmp_path / "keyfile"
+    key_file.write_bytes(b"test_key_1234567890")
+    hmac_key, _ = derive_keys(str(key_file))
+
+    source = tmp_path / "secret.env"
+    source.write_text("SECRET=12345")
+    # Age the file past the racy-timestamp window so it may be cached
+    old = source.stat().st_mtime_ns - 10 * 1_000_000_000
+    os.utime(source, ns=(old, old))
+
+    cache_dir = tmp_path / "cache"
+    cache = HmacCache(hmac_key, cache_dir)
+    assert cache.get(source) is None
+    tag = compute_hmac(source, hmac_key)
+    cache.record(source, tag)
+    assert cache.get(source) == tag
+    cache.save()
+    assert (cache_dir / "hashes.json").exists()
+    assert (cache_dir / ".gitignore").read_text().strip().endswith("*")
+
+    # A fresh instance reads the stored entry back
+    reloaded = HmacCache(hmac_key, cache_dir)
+    assert reloaded.get(source) == tag
+
+    # A different key discards the cache
+    other_key, _ = derive_keys(str(key_file), salt=b"other-salt")
+    assert HmacCache(other_key, cache_dir).get(source) is None
+
+    # Changing the file invalidates the entry
+    source.write_text("SECRET=67890")
+    assert reloaded.get(source) is None
+
+
+def test_walk_files_filters_by_name_and_recurses(tmp_path):
+    """Test walk_files yields matching files from nested directories only."""
+    from vaulttool.utils import walk_files
+
+    (tmp_path / "sub" / "deeper").mkdir(parents=True)
+    (tmp_path / "a.env.vault").write_text("x")
+    (tmp_path / "sub" / "b.env.vault").write_text("x")
+    (tmp_path / "sub" / "deeper" / "c.env.vault").write_text("x")
+    (tmp_path / "sub" / "plain.env").write_text("x")
+    (tmp_path / "dir.vault").mkdir()  # directories never match
+
+    found = sorted(os.path.relpath(p, tmp_path) for p in walk_files(tmp_path, lambda n: n.endswith(".vault")))
+    assert found == ["a.env.vault", os.path.join("sub", "b.env.vault"), os.path.join("sub", "deeper", "c.env.vault")]
+    assert len(list(walk_files(tmp_path))) == 4
+
+
+def test_atomic_file_replaces_on_success_only(tmp_path):
+    """Test atomic_file swaps in complete content, keeps the mode, and cleans up on error."""
+    import stat
+    import sys
+    from vaulttool.utils import atomic_file
+
+    target = tmp_path / "config.env.vault"
+    with atomic_file(target) as f:
+        f.write(b"first")
+    assert target.read_bytes() == b"first"
+    if sys.platform != "win32":
+        assert stat.S_IMODE(target.stat().st_mode) == 0o600
+        target.chmod(0o644)
+
+    with atomic_file(target) as f:
+        f.write(b"second")
+    assert target.read_bytes() == b"second"
+    if sys.platform != "win32":
+        assert stat.S_IMODE(target.stat().st_mode) == 0o644
+
+    with pytest.raises(RuntimeError):
+        with atomic_file(target) as f:
+            f.write(b"partial")
+            raise RuntimeError("interrupted")
+    assert target.read_bytes() == b"second"
+    assert os.listdir(tmp_path) == ["config.env.vault"]
+
+
+def test_write_private_file_creates_owner_only_file(tmp_path):
+    """Test write_private_file writes all bytes and creates the file with mode 0o600."""
+    import stat
+    import sys
+    from vaulttool.utils import write_private_file
+
+    target = tmp_path / "secret.env"
+    data = b"SECRET=" + b"x" * 200_000
+    write_private_file(target, data)
+    assert target.read_bytes() == data
+    if sys.platform != "win32":
+        assert stat.S_IMODE(target.stat().st_mode) == 0o600
+
+    # Overwrites truncate previous content
+    write_private_file(target, b"short")
+    assert target.read_bytes() == b"short"
+
+
+def test_compute_hmac_large_file_matches_small_path(tmp_path):
+    """Test the memory-mapped HMAC path yields the same tag as hashing the bytes."""
+    import hashlib
+    import hmac
+    from vaulttool.utils import MMAP_THRESHOLD
+
+    key = b"k" * 32
+    data = os.urandom(MMAP_THRESHOLD * 3 + 17)
+    big = tmp_path / "big.bin"
+    big.write_bytes(data)
+    assert compute_hmac(big, key) == hmac.new(key, data, hashlib.sha256).hexdigest()
+
+
+@pytest.mark.parametrize("use_file_digest", [True, False])
+def test_compute_hmac_small_file_paths_agree(tmp_path, monkeypatch, use_file_digest):
+    """Test small-file HMAC matches with and without hashlib.file_digest."""
+    import hashlib
+    import hmac
+    from vaulttool import utils
+
+    if not use_file_digest:
+        monkeypatch.setattr(utils, "_file_digest", None)
+    key = b"k" * 32
+    data = os.urandom(10_000)
+    small = tmp_path / "small.bin"
+    small.write_bytes(data)
+    assert compute_hmac(small, key) == hmac.new(key, data, hashlib.sha256).hexdigest()
+
+
+def test_iter_base64_matches_one_shot_encoding():
+    """Test chunked base64 output equals encoding the joined input."""
+    from vaulttool.utils import iter_base64
+
+    data = os.urandom(1000)
+    for sizes in ([1000], [1, 2, 3, 994], [16, 7, 977], [0, 500, 0, 500]):
+        chunks, offset = [], 0
+        for size in sizes:
+            chunks.append(data[offset:offset + size])
+            offset += size
+        assert b"".join(iter_base64(chunks)) == encode_base64(data)
+    assert b"".join(iter_base64([])) == b""
+
+
+@pytest.mark.parametrize("use_file_digest", [True, False])
+def test_compute_checksum_paths_agree(tmp_path, monkeypatch, use_file_digest):
+    """Test compute_checksum matches sha256 with and without hashlib.file_digest."""
+    import hashlib
+    from vaulttool import utils
+
+    if not use_file_digest:
+        monkeypatch.setattr(utils, "_file_digest", None)
+    data = os.urandom(300_000)
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+    assert compute_checksum(path) == hashlib.sha256(data).hexdigest()
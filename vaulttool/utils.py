@@ -7,14 +7,31 @@ checksums, and encoding used throughout the VaultTool package.
 import hashlib
 import hmac
 import base64
+import json
 import logging
-from typing import Union, Tuple
+import mmap
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Union, Tuple
 from pathlib import Path
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
+from .filestamp import stat_is_racy
+
 logger = logging.getLogger(__name__)
 
+# Directory (relative to the working directory) holding VaultTool's local caches
+CACHE_DIR_NAME: str = ".vaulttool-cache"
+
+# Files larger than this are memory-mapped for hashing/encryption instead of read
+MMAP_THRESHOLD: int = 64 * 1024
+
+# hashlib.file_digest (Python 3.11+) hashes a file in a C read loop
+_file_digest = getattr(hashlib, "file_digest", None)
+
 
 def derive_keys(key_file: str, salt: bytes = b"vaulttool-v1") -> Tuple[bytes, bytes]:
     """Derive HMAC and encryption keys from a master key file using HKDF.
@@ -40,7 +57,7 @@ def derive_keys(key_file: str, salt: bytes = b"vaulttool-v1") -> Tuple[bytes, by
     """
     key_path = Path(key_file).resolve()
 
-    logger.debug(f"Deriving keys from key file: {key_file}")
+    logger.debug("Deriving keys from key file: %s", key_file)
 
     # Validate file exists and is a regular file
     if not key_path.exists():
@@ -52,7 +69,7 @@ def derive_keys(key_file: str, salt: bytes = b"vaulttool-v1") -> Tuple[bytes, by
 
     # Check file size (prevent reading huge files, require minimum entropy)
     file_size = key_path.stat().st_size
-    logger.debug(f"Key file size: {file_size} bytes")
+    logger.debug("Key file size: %s bytes", file_size)
     if file_size == 0:
         logger.error(f"Key file is empty: {key_file}")
         raise ValueError(f"Key file is empty: {key_file}")
@@ -75,7 +92,7 @@ def derive_keys(key_file: str, salt: bytes = b"vaulttool-v1") -> Tuple[bytes, by
         logger.error(f"Key material too short after stripping: {len(master_key)} bytes")
         raise ValueError(f"Key material too short after stripping: {len(master_key)} bytes (minimum 16 bytes)")
 
-    logger.debug(f"Key material: {len(master_key)} bytes")
+    logger.debug("Key material: %s bytes", len(master_key))
 
     # Derive HMAC key (32 bytes for SHA-256)
     hkdf_hmac = HKDF(
@@ -96,7 +113,7 @@ def derive_keys(key_file: str, salt: bytes = b"vaulttool-v1") -> Tuple[bytes, by
     try:
         hmac_key = hkdf_hmac.derive(master_key)
         encryption_key = hkdf_enc.derive(master_key)
-        logger.debug(f"Successfully derived HMAC key (32 bytes) and encryption key (32 bytes) from {key_file}")
+        logger.debug("Successfully derived HMAC key (32 bytes) and encryption key (32 bytes) from %s", key_file)
         return hmac_key, encryption_key
     except Exception as e:
         logger.error(f"Key derivation failed for {key_file}: {e}", exc_info=True)
@@ -106,8 +123,9 @@ def derive_keys(key_file: str, salt: bytes = b"vaulttool-v1") -> Tuple[bytes, by
 def compute_hmac(path: Union[str, Path], hmac_key: bytes) -> str:
     """Compute HMAC-SHA256 of a file for authentication.
 
-    Reads the file in chunks to efficiently handle large files while
-    computing an HMAC for integrity verification and authentication.
+    Small files are hashed with hashlib.file_digest where available (chunked
+    reads otherwise); files above MMAP_THRESHOLD are memory-mapped and hashed
+    in one call without copying them.
 
     Args:
         path: Path to the file to authenticate. Can be a string or Path object.
@@ -123,13 +141,21 @@ def compute_hmac(path: Union[str, Path], hmac_key: bytes) -> str:
         >>> compute_hmac("myfile.txt", hmac_key)
         "a665a45920422f9d417e4867efdc4fb8a04a1f3fff1fa07e998e86f7f7a27ae3"
     """
-    logger.debug(f"Computing HMAC for file: {path}")
-    h = hmac.new(hmac_key, digestmod=hashlib.sha256)
+    logger.debug("Computing HMAC for file: %s", path)
     with open(path, "rb") as f:
-        while chunk := f.read(8192):
-            h.update(chunk)
+        if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+            # Hash the mapped pages directly; no intermediate chunk copies
+            h = hmac.new(hmac_key, digestmod=hashlib.sha256)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+        elif _file_digest is not None:
+            h = _file_digest(f, lambda: hmac.new(hmac_key, digestmod=hashlib.sha256))
+        else:
+            h = hmac.new(hmac_key, digestmod=hashlib.sha256)
+            while chunk := f.read(8192):
+                h.update(chunk)
     result = h.hexdigest()
-    logger.debug(f"HMAC computed: {result[:16]}...")
+    logger.debug("HMAC computed: %s...", result[:16])
     return result
 
 
@@ -139,8 +165,8 @@ def compute_checksum(path: Union[str, Path]) -> str:
     DEPRECATED: Use compute_hmac() for authenticated integrity checking.
     This function is kept for backwards compatibility only.
 
-    Reads the file in chunks to efficiently handle large files while
-    computing a cryptographic hash for change detection.
+    Hashes the file with hashlib.file_digest where available (a C read loop
+    into a reusable buffer), falling back to chunked reads on Python 3.10.
 
     Args:
         path: Path to the file to checksum. Can be a string or Path object.
@@ -155,13 +181,241 @@ def compute_checksum(path: Union[str, Path]) -> str:
         >>> compute_checksum("myfile.txt")
         "a665a45920422f9d417e4867efdc4fb8a04a1f3fff1fa07e998e86f7f7a27ae3"
     """
-    h = hashlib.sha256()
     with open(path, "rb") as f:
+        if _file_digest is not None:
+            return _file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
         while chunk := f.read(8192):
             h.update(chunk)
     return h.hexdigest()
 
 
+def walk_files(
+    root: Union[str, Path],
+    match: Optional[Callable[[str], bool]] = None,
+    prune: Optional[Callable[[str], bool]] = None,
+    on_dir: Optional[Callable[[str], None]] = None,
+) -> Iterator[str]:
+    """Recursively yield paths of files below a directory using os.scandir.
+
+    Unlike ``Path.rglob``, directory entries carry their type from the directory
+    listing, so names rejected by ``match`` cost no extra ``stat`` call. Symlinked
+    directories are not descended into (same as ``Path.rglob``).
+
+    Args:
+        root: Directory to walk.
+        match: Optional predicate on the file name; only matching files are yielded.
+        prune: Optional predicate on a subdirectory path; matching directories
+            are not descended into.
+        on_dir: Optional callback invoked with each directory path just before
+            it is listed.
+
+    Yields:
+        str: Path of each matching file, joined onto ``root``.
+
+    Example:
+        >>> list(walk_files(".", lambda name: name.endswith(".vault")))
+        ['./config.env.vault']
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        if on_dir is not None:
+            on_dir(directory)
+        try:
+            entries = os.scandir(directory)
+        except OSError as e:
+            logger.debug("Cannot scan directory %s: %s", directory, e)
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if prune is None or not prune(entry.path):
+                        stack.append(entry.path)
+                elif (match is None or match(entry.name)) and entry.is_file():
+                    yield entry.path
+
+
+class HmacCache:
+    """Persistent cache of source file HMACs keyed by their stat stamp.
+
+    Avoids re-reading and re-hashing source files that have not changed since
+    the last run. Each entry maps an absolute path to ``[st_ino, st_mtime_ns,
+    st_size, hmac]``; any change to the stamp forces a recompute. VaultTool
+    also records the HMAC stored on a vault file's first line under the
+    vault's own path, so unchanged vaults need not be reopened. The cache is
+    bound to a fingerprint of the HMAC key, so it is discarded after a rekey.
+
+    The cache lives in ``.vaulttool-cache/hashes.json`` and the directory
+    ignores itself via its own ``.gitignore``. Read or write failures are
+    never fatal: the cache simply behaves as empty.
+
+    Example:
+        >>> cache = HmacCache(hmac_key)
+        >>> if cache.get("config.env") is None:
+        ...     cache.record("config.env", compute_hmac("config.env", hmac_key))
+        >>> cache.save()
+    """
+
+    def __init__(self, hmac_key: bytes, cache_dir: Union[str, Path] = CACHE_DIR_NAME):
+        """Load the cache for the given HMAC key.
+
+        Args:
+            hmac_key: The HMAC key used to authenticate source files.
+            cache_dir: Directory holding the cache file.
+        """
+        self.cache_dir = Path(cache_dir).absolute()
+        self.path = self.cache_dir / "hashes.json"
+        self._hmac_key = hmac_key
+        self._fingerprint = hmac.new(hmac_key, b"vaulttool-hmac-cache", hashlib.sha256).hexdigest()
+        self._entries: Dict[str, List] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable HMAC cache %s: %s", self.path, e)
+            return
+
+        if not isinstance(data, dict) or data.get("key") != self._fingerprint:
+            logger.debug("HMAC cache %s belongs to a different key, ignoring it", self.path)
+            return
+        entries = data.get("entries")
+        if isinstance(entries, dict):
+            self._entries = entries
+
+    def get(self, path: Union[str, Path], st: Optional[os.stat_result] = None) -> Optional[str]:
+        """Return the cached HMAC for a file if its stat stamp is unchanged.
+
+        Args:
+            path: Path to the source file.
+            st: Result of ``os.stat(path)`` if the caller already has it.
+
+        Returns:
+            The cached HMAC hex string, or None on a cache miss.
+        """
+        if st is None:
+            st = os.stat(path)
+        entry = self._entries.get(os.path.abspath(path))
+        if entry and entry[:3] == [st.st_ino, st.st_mtime_ns, st.st_size]:
+            return entry[3]
+        return None
+
+    def record(self, path: Union[str, Path], hmac_tag: str, st: Optional[os.stat_result] = None) -> None:
+        """Store the HMAC of a file under its current stat stamp.
+
+        Files modified within the last couple of seconds are skipped, since a
+        same-size rewrite in the same timestamp tick would go unnoticed.
+
+        Args:
+            path: Path to the source file.
+            hmac_tag: HMAC hex string of the file's current content.
+            st: Result of ``os.stat(path)`` taken before the content was hashed.
+        """
+        if st is None:
+            st = os.stat(path)
+        if stat_is_racy(st):
+            return
+        entry = [st.st_ino, st.st_mtime_ns, st.st_size, hmac_tag]
+        key = os.path.abspath(path)
+        if self._entries.get(key) != entry:
+            self._entries[key] = entry
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed, dropping entries for deleted files."""
+        if not self._dirty:
+            return
+        entries = {p: e for p, e in self._entries.items() if os.path.exists(p)}
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            gitignore = self.cache_dir / ".gitignore"
+            if not gitignore.exists():
+                gitignore.write_text("# Created by vaulttool\n*\n", encoding="utf-8")
+            # A unique temp name keeps concurrent runs from clobbering each other's write
+            with atomic_file(self.path) as f:
+                f.write(json.dumps({"key": self._fingerprint, "entries": entries}).encode("utf-8"))
+            self._entries = entries
+            self._dirty = False
+        except OSError as e:
+            logger.debug("Could not write HMAC cache %s: %s", self.path, e)
+
+
+def write_private_file(path: Union[str, Path], data: bytes) -> None:
+    """Write bytes to a file readable only by its owner.
+
+    Opens the file with ``os.open`` and writes the raw bytes with ``os.write``,
+    skipping the buffered file-object layer. Newly created files get mode 0o600
+    regardless of the umask, so decrypted secrets are never world-readable;
+    existing files keep their current mode.
+
+    Args:
+        path: Destination file path. Truncated if it exists.
+        data: Bytes to write.
+
+    Raises:
+        OSError: If the file cannot be opened or written.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o600)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def atomic_file(path: Union[str, Path]) -> Iterator[BinaryIO]:
+    """Write a file through a temporary sibling that replaces it in one rename.
+
+    Yields a binary file opened read/write on a uniquely named temporary file in
+    the destination directory. When the block completes, the data is flushed
+    and fsynced and ``os.replace`` swaps it in, so readers see either the old
+    file or the complete new one. If the block raises, the temporary file is
+    removed and the destination is left untouched. Like
+    :func:`write_private_file`, new files get mode 0o600 and existing files
+    keep their current mode.
+
+    Args:
+        path: Destination file path.
+
+    Yields:
+        BinaryIO: The temporary file to write to.
+
+    Raises:
+        OSError: If the temporary file cannot be created, written or renamed.
+
+    Example:
+        >>> with atomic_file("config.env.vault") as f:
+        ...     f.write(b"data")
+    """
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w+b") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def encode_base64(data: bytes) -> bytes:
     """Encode binary data as base64.
 
@@ -181,6 +435,34 @@ def encode_base64(data: bytes) -> bytes:
     return base64.b64encode(data)
 
 
+def iter_base64(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Base64-encode a stream of byte chunks piece by piece.
+
+    Chunks are re-cut at multiples of 3 bytes, so the concatenated output is
+    identical to ``encode_base64(b"".join(chunks))`` while only one chunk is
+    held in memory at a time.
+
+    Args:
+        chunks: Byte chunks of arbitrary sizes.
+
+    Yields:
+        Base64-encoded pieces; padding only appears in the last one.
+
+    Example:
+        >>> b"".join(iter_base64([b"hello", b" world"]))
+        b'aGVsbG8gd29ybGQ='
+    """
+    pending = b""
+    for chunk in chunks:
+        pending += chunk
+        cut = len(pending) - len(pending) % 3
+        if cut:
+            yield base64.b64encode(pending[:cut])
+            pending = pending[cut:]
+    if pending:
+        yield base64.b64encode(pending)
+
+
 def get_git_branch() -> str:
     """Get the current git branch name.
 
@@ -222,11 +504,11 @@ def get_git_branch() -> str:
             sanitized = re.sub(r'-+', '-', sanitized)
 
             if sanitized and sanitized != 'HEAD':
-                logger.debug(f"Detected git branch: {sanitized}")
+                logger.debug("Detected git branch: %s", sanitized)
                 return sanitized
 
     except (FileNotFoundError, subprocess.TimeoutExpired, Exception) as e:
-        logger.debug(f"Could not determine git branch via command: {e}")
+        logger.debug("Could not determine git branch via command: %s", e)
 
     # Fallback: try reading .git/HEAD directly
     try:
@@ -241,10 +523,10 @@ def get_git_branch() -> str:
                 sanitized = re.sub(r'-+', '-', sanitized)
 
                 if sanitized:
-                    logger.debug(f"Detected git branch from .git/HEAD: {sanitized}")
+                    logger.debug("Detected git branch from .git/HEAD: %s", sanitized)
                     return sanitized
     except Exception as e:
-        logger.debug(f"Could not read .git/HEAD: {e}")
+        logger.debug("Could not read .git/HEAD: %s", e)
 
     # Default fallback
     logger.debug("No git branch detected, using 'main' as default")